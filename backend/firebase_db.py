@@ -4,6 +4,14 @@ Handles Firestore database operations for users, resumes, and interviews
 """
 
 import os
+import hashlib
+import itertools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import cachetools
+import orjson
 import firebase_admin
 from firebase_admin import credentials, firestore, auth
 from datetime import datetime
@@ -12,6 +20,57 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# In-process cache for user documents. Repeat reads within a request lifecycle
+# (auth check, profile fetch, resume view) hit the cache instead of Firestore.
+_user_cache = cachetools.TTLCache(maxsize=10000, ttl=60)
+_user_cache_lock = threading.RLock()
+
+
+# Write-combining buffer for last-login stamps. Sign-ins only record the
+# timestamp here (O(1), no I/O); a background thread drains the buffer once a
+# second into a single WriteBatch, coalescing rapid re-logins per uid.
+_login_buffer: Dict[str, datetime] = {}
+_login_lock = threading.Lock()
+_login_flusher = None
+
+
+def _flush_login_buffer():
+    while True:
+        time.sleep(1.0)
+        with _login_lock:
+            drained = dict(_login_buffer)
+            _login_buffer.clear()
+        if not drained:
+            continue
+        try:
+            db = get_db()
+            entries = list(drained.items())
+            # Firestore batches cap at 500 ops
+            for i in range(0, len(entries), 500):
+                batch = db.batch()
+                for uid, ts in entries[i:i + 500]:
+                    batch.update(db.collection('users').document(uid), {"last_login": ts})
+                batch.commit()
+        except Exception as e:
+            logger.error(f"Error flushing last-login buffer: {str(e)}")
+
+
+def _ensure_login_flusher():
+    global _login_flusher
+    if _login_flusher is None:
+        _login_flusher = threading.Thread(
+            target=_flush_login_buffer, name="last-login-flusher", daemon=True
+        )
+        _login_flusher.start()
+
+
+def _profile_hash(profile_data: Optional[Dict]) -> bytes:
+    """Content hash of a profile dict, insensitive to key order"""
+    return hashlib.blake2b(
+        orjson.dumps(profile_data, option=orjson.OPT_SORT_KEYS),
+        digest_size=16
+    ).digest()
+
 # Initialize Firebase Admin SDK
 def initialize_firebase():
     """Initialize Firebase Admin SDK with service account credentials"""
@@ -33,12 +92,23 @@ def initialize_firebase():
         logger.error(f"Failed to initialize Firebase: {str(e)}")
         return False
 
-# Get Firestore client
+# Firestore client pool. Each client carries its own gRPC channel, so a small
+# round-robin pool avoids serializing all requests on a single channel.
+_db_pool = None
+_db_pool_lock = threading.Lock()
+
+
 def get_db():
-    """Get Firestore database client"""
-    if not firebase_admin._apps:
-        initialize_firebase()
-    return firestore.client()
+    """Get a Firestore database client from the round-robin pool"""
+    global _db_pool
+    if _db_pool is None:
+        with _db_pool_lock:
+            if _db_pool is None:
+                if not firebase_admin._apps:
+                    initialize_firebase()
+                pool_size = int(os.getenv("FIRESTORE_POOL_SIZE", "4"))
+                _db_pool = itertools.cycle([firestore.client() for _ in range(pool_size)])
+    return next(_db_pool)
 
 # User operations
 class UserDB:
@@ -75,8 +145,10 @@ class UserDB:
             }
             
             db.collection('users').document(user.uid).set(user_data)
+            with _user_cache_lock:
+                _user_cache[user.uid] = user_data
             logger.info(f"User created successfully: {email}")
-            
+
             return {"uid": user.uid, "email": email, "name": name}
         
         except auth.EmailAlreadyExistsError:
@@ -87,44 +159,142 @@ class UserDB:
             return None
     
     @staticmethod
-    def get_user(uid: str) -> Optional[Dict]:
-        """Get user profile from Firestore"""
+    def user_exists(uid: str) -> bool:
+        """Check whether a user doc exists without deserializing it"""
         try:
+            with _user_cache_lock:
+                if uid in _user_cache:
+                    return True
             db = get_db()
-            doc = db.collection('users').document(uid).get()
-            
+            return db.collection('users').document(uid).get(field_paths=['uid']).exists
+        except Exception as e:
+            logger.error(f"Error checking user existence: {str(e)}")
+            return False
+
+    @staticmethod
+    def get_user(uid: str, fields: Optional[List[str]] = None) -> Optional[Dict]:
+        """Get user profile from Firestore (cached for 60s).
+
+        Pass `fields` to fetch only specific top-level fields; Firestore then
+        transfers and deserializes just those paths instead of the whole doc.
+        """
+        try:
+            with _user_cache_lock:
+                cached = _user_cache.get(uid)
+            if cached is not None:
+                if fields:
+                    return {k: cached[k] for k in fields if k in cached}
+                return cached
+
+            db = get_db()
+            ref = db.collection('users').document(uid)
+            doc = ref.get(field_paths=fields) if fields else ref.get()
+
             if doc.exists:
-                return doc.to_dict()
+                user_data = doc.to_dict()
+                if not fields:
+                    # Only cache complete documents
+                    with _user_cache_lock:
+                        _user_cache[uid] = user_data
+                return user_data
             return None
         except Exception as e:
             logger.error(f"Error getting user: {str(e)}")
             return None
-    
+
+    @staticmethod
+    def get_users(uids: List[str]) -> Dict[str, Dict]:
+        """Get several user profiles in a single batched read.
+
+        Uses Firestore's get_all (one BatchGetDocuments RPC) so latency is
+        one round-trip instead of one per uid.
+        """
+        if not uids:
+            return {}
+        try:
+            db = get_db()
+            refs = [db.collection('users').document(uid) for uid in uids]
+            users = {doc.id: doc.to_dict() for doc in db.get_all(refs) if doc.exists}
+            with _user_cache_lock:
+                _user_cache.update(users)
+            return users
+        except Exception as e:
+            logger.error(f"Error getting users: {str(e)}")
+            return {}
+
+    @staticmethod
+    def get_user_with_resume(uid: str) -> Dict[str, Optional[Dict]]:
+        """Fetch a user's profile and resume together in one batched read"""
+        try:
+            db = get_db()
+            user_ref = db.collection('users').document(uid)
+            resume_ref = db.collection('resumes').document(uid)
+
+            result = {"user": None, "resume": None}
+            for doc in db.get_all([user_ref, resume_ref]):
+                if not doc.exists:
+                    continue
+                if doc.reference.parent.id == 'users':
+                    result["user"] = doc.to_dict()
+                else:
+                    result["resume"] = doc.to_dict()
+
+            if result["user"] is not None:
+                with _user_cache_lock:
+                    _user_cache[uid] = result["user"]
+            return result
+        except Exception as e:
+            logger.error(f"Error getting user with resume: {str(e)}")
+            return {"user": None, "resume": None}
+
     @staticmethod
     def update_profile(uid: str, profile_data: Dict) -> bool:
-        """Update user profile"""
+        """Update user profile (skips the write if nothing changed)"""
         try:
+            # SPA save buttons re-send the whole form; don't pay a billable
+            # write (and listener fan-out) for data we already have.
+            with _user_cache_lock:
+                cached = _user_cache.get(uid)
+            if cached is not None and _profile_hash(cached.get("profile")) == _profile_hash(profile_data):
+                logger.info(f"Profile unchanged for user {uid}, skipping write")
+                return True
+
             db = get_db()
             db.collection('users').document(uid).update({
                 "profile": profile_data,
-                "updated_at": datetime.utcnow()
+                "updated_at": firestore.SERVER_TIMESTAMP
             })
+            # Write-through: keep the cached entry warm instead of evicting it.
+            # updated_at is assigned server-side; the local clock is close enough
+            # for the cache's 60s lifetime.
+            with _user_cache_lock:
+                cached = _user_cache.get(uid)
+                if cached is not None:
+                    cached["profile"] = profile_data
+                    cached["updated_at"] = datetime.utcnow()
             logger.info(f"Profile updated for user: {uid}")
             return True
         except Exception as e:
             logger.error(f"Error updating profile: {str(e)}")
             return False
-    
+
     @staticmethod
     def update_last_login(uid: str):
-        """Update last login timestamp"""
-        try:
-            db = get_db()
-            db.collection('users').document(uid).update({
-                "last_login": datetime.utcnow()
-            })
-        except Exception as e:
-            logger.error(f"Error updating last login: {str(e)}")
+        """Record last login timestamp (flushed asynchronously)"""
+        last_login = datetime.utcnow()
+        _ensure_login_flusher()
+        with _login_lock:
+            _login_buffer[uid] = last_login
+        with _user_cache_lock:
+            cached = _user_cache.get(uid)
+            if cached is not None:
+                cached["last_login"] = last_login
+
+    @staticmethod
+    def invalidate(uid: str):
+        """Drop a user from the cache (for callers that mutate outside UserDB)"""
+        with _user_cache_lock:
+            _user_cache.pop(uid, None)
 
 # Resume operations
 class ResumeDB:
@@ -150,12 +320,17 @@ class ResumeDB:
             return False
     
     @staticmethod
-    def get_resume(uid: str) -> Optional[Dict]:
-        """Get resume data from Firestore"""
+    def get_resume(uid: str, fields: Optional[List[str]] = None) -> Optional[Dict]:
+        """Get resume data from Firestore.
+
+        Listing views should pass fields=['uploaded_at', 'file_url'] to skip
+        transferring the full parsed_data payload.
+        """
         try:
             db = get_db()
-            doc = db.collection('resumes').document(uid).get()
-            
+            ref = db.collection('resumes').document(uid)
+            doc = ref.get(field_paths=fields) if fields else ref.get()
+
             if doc.exists:
                 return doc.to_dict()
             return None
@@ -166,7 +341,19 @@ class ResumeDB:
 # Interview operations
 class InterviewDB:
     """Interview history database operations"""
-    
+
+    # Light fields kept on the top-level interview doc; everything else
+    # (full transcripts, per-frame metrics, suggestions) goes into a
+    # details subdocument so history listings read only a few bytes.
+    SUMMARY_FIELDS = ('user_id', 'session_date', 'role', 'overall_score', 'duration_sec')
+
+    @staticmethod
+    def _split_interview(interview_data: Dict) -> tuple:
+        """Split an interview dict into (summary, details) parts"""
+        summary = {k: v for k, v in interview_data.items() if k in InterviewDB.SUMMARY_FIELDS}
+        details = {k: v for k, v in interview_data.items() if k not in InterviewDB.SUMMARY_FIELDS}
+        return summary, details
+
     @staticmethod
     def save_interview(uid: str, interview_data: Dict) -> Optional[str]:
         """Save interview session to Firestore"""
@@ -174,26 +361,91 @@ class InterviewDB:
             db = get_db()
             interview_data["user_id"] = uid
             interview_data["session_date"] = datetime.utcnow()
-            
-            doc_ref = db.collection('interviews').add(interview_data)
+
+            summary, details = InterviewDB._split_interview(interview_data)
+            doc_ref = db.collection('interviews').document()
+            doc_ref.set(summary)
+            if details:
+                doc_ref.collection('details').document('payload').set(details)
             logger.info(f"Interview saved for user: {uid}")
-            return doc_ref[1].id
+            return doc_ref.id
         except Exception as e:
             logger.error(f"Error saving interview: {str(e)}")
             return None
+
+    @staticmethod
+    def get_interview_details(interview_id: str) -> Optional[Dict]:
+        """Get the heavy payload (transcript, metrics) for one interview"""
+        try:
+            db = get_db()
+            doc = db.collection('interviews').document(interview_id)\
+                .collection('details').document('payload').get()
+
+            if doc.exists:
+                return doc.to_dict()
+            return None
+        except Exception as e:
+            logger.error(f"Error getting interview details: {str(e)}")
+            return None
     
+    @staticmethod
+    def save_interviews(uid: str, items: List[Dict], batch_size: int = 200, pool_size: int = 10) -> int:
+        """Bulk-save interview sessions using WriteBatch chunks.
+
+        Each interview costs two write ops (summary + details), so chunks of
+        200 stay under Firestore's 500-op batch limit. Chunks commit in
+        parallel through a thread pool, so throughput scales with the network
+        rather than serializing one write per interview.
+
+        Returns the number of interviews written.
+        """
+        if not items:
+            return 0
+        try:
+            db = get_db()
+            session_date = datetime.utcnow()
+
+            def _commit_chunk(chunk: List[Dict]) -> int:
+                batch = db.batch()
+                for item in chunk:
+                    item["user_id"] = uid
+                    item.setdefault("session_date", session_date)
+                    summary, details = InterviewDB._split_interview(item)
+                    doc_ref = db.collection('interviews').document()
+                    batch.set(doc_ref, summary)
+                    if details:
+                        batch.set(doc_ref.collection('details').document('payload'), details)
+                batch.commit()
+                return len(chunk)
+
+            chunks = [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+            with ThreadPoolExecutor(max_workers=min(pool_size, len(chunks))) as executor:
+                written = sum(executor.map(_commit_chunk, chunks))
+
+            logger.info(f"Saved {written} interviews for user: {uid}")
+            return written
+        except Exception as e:
+            logger.error(f"Error bulk-saving interviews: {str(e)}")
+            return 0
+
     @staticmethod
     def get_user_interviews(uid: str, limit: int = 10) -> List[Dict]:
-        """Get user's interview history"""
+        """Get user's interview history (summary fields only).
+
+        Relies on the (user_id ASC, session_date DESC) composite index
+        declared in firestore.indexes.json, so Firestore does an indexed
+        range scan instead of returning docs to filter client-side.
+        """
         try:
             db = get_db()
             interviews = db.collection('interviews')\
                 .where('user_id', '==', uid)\
                 .order_by('session_date', direction=firestore.Query.DESCENDING)\
                 .limit(limit)\
+                .select(['session_date', 'role', 'overall_score'])\
                 .stream()
-            
-            return [interview.to_dict() for interview in interviews]
+
+            return [{"id": interview.id, **interview.to_dict()} for interview in interviews]
         except Exception as e:
             logger.error(f"Error getting interviews: {str(e)}")
             return []
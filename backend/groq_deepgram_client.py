@@ -4,75 +4,487 @@ Handles speech-to-text transcription and answer evaluation using production APIs
 """
 
 import os
+import hashlib
 import logging
 import json
-from typing import Optional
+import random
+import re
+import string
+import asyncio
+from typing import AsyncIterator, BinaryIO, Optional, Union
+
+import cachetools
+import httpx
+import orjson
+from pydantic import BaseModel, Field, field_validator
+
+from llm_cache import cached_llm, _cache
 
 logger = logging.getLogger(__name__)
 
 # API Configuration
 GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")
 DEEPGRAM_API_KEY = os.getenv("DEEPGRAM_API_KEY", "")
+# STT model tier. nova-2 is Deepgram's fast default; deployments can trade
+# latency for accuracy (or cost) without a code change.
+DEEPGRAM_MODEL = os.getenv("DEEPGRAM_MODEL", "nova-2")
+
+# Smaller, much faster Groq model for classification-style calls (per-line
+# transcript labelling); the headline evaluation stays on the 70B model
+GROQ_FAST_MODEL = os.getenv("GROQ_FAST_MODEL", "llama-3.1-8b-instant")
+
+# Shared async HTTP client. Keeps connections pooled and alive across calls
+# so concurrent Deepgram/Groq requests overlap instead of blocking a worker,
+# and the TLS handshake to each API host is paid once, not per call.
+_http = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=50, max_connections=200),
+    timeout=60,
+    transport=httpx.AsyncHTTPTransport(retries=3),
+)
+
+GROQ_CHAT_URL = "https://api.groq.com/openai/v1/chat/completions"
+
+# Locate the JSON object/array in an LLM response in one pass. Models often
+# wrap output in markdown fences or prose; the greedy match spans from the
+# first opening bracket to the last closing one.
+_JSON_OBJ_RE = re.compile(r"\{.*\}", re.S)
+_JSON_ARR_RE = re.compile(r"\[.*\]", re.S)
+_JSON_FENCE_RE = re.compile(r"```(?:json)?\s*([\{\[].*?[\}\]])\s*```", re.S)
+
+
+def _extract_json(response_text: str, array: bool = False):
+    """Find and decode the JSON object (or array) embedded in model output.
+
+    Tries a fenced ```json block first, then the widest brace/bracket
+    span — one precompiled-regex pass instead of repeated split/find
+    string allocations.
+    """
+    match = _JSON_FENCE_RE.search(response_text)
+    if match:
+        return orjson.loads(match.group(1))
+    match = (_JSON_ARR_RE if array else _JSON_OBJ_RE).search(response_text)
+    return orjson.loads(match.group(0) if match else response_text)
+
+
+class Suggestion(BaseModel):
+    """One improvement suggestion in the enhanced format"""
+    improvement: str = "Continue practicing"
+    context: str = "General"
+    better_approach: str = ""
+
+
+class Evaluation(BaseModel):
+    """Normalized shape of a Groq evaluation response.
+
+    model_validate runs in pydantic's compiled core, replacing the scattered
+    isinstance/clamp/pad guards the parser used to walk on every call.
+    """
+    score: float = Field(5.0, ge=1, le=10)
+    reasoning: str = "No reasoning provided"
+    suggestions: list[Suggestion] = Field(default_factory=list, validate_default=True)
+    confidence_assessment: str = "Moderate confidence displayed"
+    communication_quality: str = "Clear communication"
+    behavioral_insights: dict = Field(default_factory=lambda: {
+        "eye_contact_analysis": "",
+        "filler_word_impact": "",
+        "speech_pace_feedback": ""
+    })
+
+    @field_validator("score", mode="before")
+    @classmethod
+    def _clamp_score(cls, v):
+        try:
+            v = float(v)
+        except (TypeError, ValueError):
+            return 5.0
+        return max(1.0, min(10.0, v))
 
+    @field_validator("reasoning", "confidence_assessment", "communication_quality", mode="before")
+    @classmethod
+    def _coerce_str(cls, v):
+        return v if isinstance(v, str) else str(v)
 
-def transcribe_audio_deepgram(audio_bytes: bytes, language: str = "en") -> dict:
+    @field_validator("suggestions", mode="before")
+    @classmethod
+    def _normalize_suggestions(cls, v):
+        if not isinstance(v, list):
+            v = [v]
+        # Accept old plain-string suggestions alongside the enhanced format
+        return [s if isinstance(s, dict) else {"improvement": str(s)} for s in v[:3]]
+
+    @field_validator("suggestions")
+    @classmethod
+    def _pad_suggestions(cls, v):
+        if len(v) >= 3:
+            return v
+        # Pad-and-truncate in one slice instead of an append loop
+        return (v + [
+            Suggestion(
+                improvement="Continue practicing interview questions",
+                better_approach="Practice with a variety of question types"
+            )
+            for _ in range(3 - len(v))
+        ])[:3]
+
+    @field_validator("behavioral_insights", mode="before")
+    @classmethod
+    def _normalize_insights(cls, v):
+        if not isinstance(v, dict):
+            v = {}
+        return {
+            "eye_contact_analysis": str(v.get("eye_contact_analysis", "")),
+            "filler_word_impact": str(v.get("filler_word_impact", "")),
+            "speech_pace_feedback": str(v.get("speech_pace_feedback", ""))
+        }
+
+
+# Evaluation rubric lives in the system message so every call shares a
+# byte-identical prefix -- the shape Groq's automatic prompt caching
+# discounts and accelerates. The user message carries only the variable
+# profile/question/transcript/metrics sections.
+_EVAL_SYSTEM_PROMPT = """You are an expert technical interviewer evaluating a candidate's interview performance.
+
+EVALUATION CRITERIA:
+1. Content Quality (40%): Technical accuracy, depth of knowledge, relevance to question
+2. Communication (30%): Clarity, confidence, minimal fumbling/filler words
+3. Visual Presence (20%): Eye contact, posture, professional demeanor
+4. Speech Delivery (10%): Appropriate pacing, minimal filler words
+
+Provide the evaluation as a JSON object with:
+- "score": 1-10 overall score based on weighted criteria
+- "reasoning": 2-3 sentences explaining the score, highlighting strengths and weaknesses
+- "suggestions": exactly 3 objects, each with "improvement" (specific, actionable),
+  "context" (SHORT transcript quote where it applies, or "General") and
+  "better_approach" (what to say instead)
+- "confidence_assessment": brief assessment of the candidate's confidence
+- "communication_quality": brief assessment of communication style and clarity
+- "behavioral_insights": object with "eye_contact_analysis", "filler_word_impact",
+  "speech_pace_feedback"
+
+Respond ONLY with valid JSON."""
+
+_EVAL_PROMPT_TMPL = string.Template("""$profile_section
+INTERVIEW QUESTION:
+$question
+
+CANDIDATE'S ANSWER:
+$transcript
+$metrics_section""")
+
+# Content-addressed cache for Groq chat completions. Identical prompts
+# (retries, repeated question/transcript pairs, dev loops) become a dict hit
+# instead of a 1-3s paid LLM round-trip. Creative calls (temperature > 0.5)
+# are never cached so users don't all see the same generated output.
+_groq_cache = cachetools.TTLCache(maxsize=512, ttl=86400)
+
+
+async def _groq_chat(
+    prompt: str,
+    model: str = "llama-3.3-70b-versatile",
+    temperature: float = 0.3,
+    max_tokens: int = 600,
+    json_response: bool = False,
+    system: Optional[str] = None
+) -> dict:
+    """
+    Send a single chat completion to Groq.
+
+    Args:
+        json_response: request response_format json_object so the model
+                       guarantees valid JSON (no markdown fences to strip)
+        system: static instruction prefix sent as the system message, so
+                Groq's automatic prompt caching can reuse its prefill
+                across calls
+
+    Returns:
+        dict: {"text": str, "error": str | None}
+    """
+    cache_key = None
+    if temperature <= 0.5:
+        cache_key = hashlib.blake2b(
+            f"{model}|{temperature}|{max_tokens}|{json_response}|{system or ''}|{prompt}".encode(),
+            digest_size=16
+        ).hexdigest()
+        cached = _groq_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Groq cache hit, skipping API call")
+            return cached
+
+    headers = {
+        "Authorization": f"Bearer {GROQ_API_KEY}",
+        "Content-Type": "application/json"
+    }
+    messages = []
+    if system:
+        messages.append({"role": "system", "content": system})
+    messages.append({"role": "user", "content": prompt})
+    payload = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens
+    }
+    if json_response:
+        payload["response_format"] = {"type": "json_object"}
+
+    response = await _http.post(GROQ_CHAT_URL, headers=headers, content=orjson.dumps(payload))
+
+    if response.status_code != 200:
+        error_msg = f"Groq API error: {response.status_code}"
+        logger.error(f"{error_msg} - {response.text}")
+        return {"text": "", "error": error_msg}
+
+    result = orjson.loads(response.content)
+    usage = result.get("usage") or {}
+    cached_tokens = (usage.get("prompt_tokens_details") or {}).get("cached_tokens")
+    if cached_tokens and logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Groq prompt cache: %s/%s tokens served from cache",
+            cached_tokens, usage.get("prompt_tokens")
+        )
+    chat = {"text": result["choices"][0]["message"]["content"].strip(), "error": None}
+
+    if cache_key is not None:
+        _groq_cache[cache_key] = chat
+    return chat
+
+
+async def _groq_chat_stream(
+    prompt: str,
+    model: str = "llama-3.3-70b-versatile",
+    temperature: float = 0.3,
+    max_tokens: int = 600
+) -> AsyncIterator[str]:
+    """
+    Stream a Groq chat completion, yielding content deltas as they arrive.
+
+    Lets callers start showing output on the first token instead of
+    waiting ~5s for the full completion. Streamed responses bypass the
+    completion cache; callers that want caching use _groq_chat.
+    """
+    headers = {
+        "Authorization": f"Bearer {GROQ_API_KEY}",
+        "Content-Type": "application/json"
+    }
+    payload = {
+        "model": model,
+        "messages": [{"role": "user", "content": prompt}],
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "stream": True
+    }
+
+    async with _http.stream(
+        "POST", GROQ_CHAT_URL, headers=headers, content=orjson.dumps(payload)
+    ) as response:
+        if response.status_code != 200:
+            await response.aread()
+            logger.error(f"Groq API error: {response.status_code} - {response.text}")
+            return
+
+        async for line in response.aiter_lines():
+            if not line.startswith("data: "):
+                continue
+            data = line[len("data: "):]
+            if data == "[DONE]":
+                break
+            delta = orjson.loads(data)["choices"][0].get("delta", {})
+            content = delta.get("content")
+            if content:
+                yield content
+
+
+def _iter_file_chunks(fileobj: BinaryIO, chunk_size: int = 64 * 1024):
+    """Yield fixed-size chunks from a file-like object for streaming uploads"""
+    while True:
+        chunk = fileobj.read(chunk_size)
+        if not chunk:
+            break
+        yield chunk
+
+
+async def transcribe_audio_deepgram(
+    audio: Union[bytes, BinaryIO],
+    language: str = "en",
+    content_length: Optional[int] = None,
+    audio_mime: str = "audio/wav",
+    smart_format: bool = False,
+    punctuate: bool = False
+) -> dict:
     """
     Transcribe audio using Deepgram API.
-    
+
     Args:
-        audio_bytes: Audio file bytes (WAV format recommended)
+        audio: Audio file bytes, or an open binary file to stream from disk
+               without buffering the whole payload in memory
         language: Language code (default: "en")
-        
+        content_length: Size in bytes when streaming a file-like object
+        audio_mime: Content type of the payload. Compressed codecs
+                    ("audio/ogg" Opus, "audio/flac") cut upload size 5-10x
+                    versus WAV and Deepgram accepts them directly
+        smart_format: Enable Deepgram smart formatting (off by default;
+                      only worth the extra processing for transcripts shown
+                      verbatim to users)
+        punctuate: Enable punctuation (same trade-off as smart_format)
+
     Returns:
         dict: {"text": str, "error": str | None}
     """
-    logger.info(f"Transcribing audio with Deepgram ({len(audio_bytes)} bytes)")
-    
+    if isinstance(audio, (bytes, bytearray)):
+        content = audio
+        size = len(audio)
+    else:
+        content = _iter_file_chunks(audio)
+        size = content_length
+
+    logger.info(f"Transcribing audio with Deepgram ({size if size is not None else 'unknown'} bytes)")
+
+    # Sub-second clips (muted mic, accidental stop) have nothing to transcribe
+    if size is not None and size < 2048:
+        logger.info("Audio payload too small to contain speech, skipping Deepgram call")
+        return {"text": "", "error": None}
+
+    # Re-submitted recordings (retries, dev iteration) replay from the disk
+    # cache instead of paying for a second transcription. Only the in-memory
+    # path is cacheable — file-like payloads are streamed, not hashed.
+    cache_key = None
+    if isinstance(audio, (bytes, bytearray)):
+        digest = hashlib.sha256(audio).hexdigest()
+        cache_key = (
+            f"deepgram_stt:{DEEPGRAM_MODEL}:{language}:{audio_mime}:"
+            f"{int(smart_format)}{int(punctuate)}:{digest}"
+        )
+        hit = _cache.get(cache_key)
+        if hit is not None:
+            logger.info("Deepgram transcription cache hit")
+            return hit
+
     if not DEEPGRAM_API_KEY:
         logger.error("DEEPGRAM_API_KEY not set")
         return {"text": "", "error": "Deepgram API key not configured"}
-    
+
     try:
-        import requests
-        
         # Use Deepgram REST API directly
         url = "https://api.deepgram.com/v1/listen"
-        
+
         headers = {
             "Authorization": f"Token {DEEPGRAM_API_KEY}",
-            "Content-Type": "audio/wav"
+            "Content-Type": audio_mime
         }
-        
+        if size is not None:
+            headers["Content-Length"] = str(size)
+
         params = {
-            "model": "nova-2",
+            "model": DEEPGRAM_MODEL,
             "language": language,
-            "smart_format": "true",
-            "punctuate": "true"
+            "smart_format": "true" if smart_format else "false",
+            "punctuate": "true" if punctuate else "false"
         }
-        
-        # Make API request
-        response = requests.post(url, headers=headers, params=params, data=audio_bytes, timeout=60)
-        
+
+        # Make API request (chunked upload when given a file-like object)
+        response = await _http.post(url, headers=headers, params=params, content=content)
+
         if response.status_code != 200:
             error_msg = f"Deepgram API error: {response.status_code}"
             logger.error(f"{error_msg} - {response.text}")
             return {"text": "", "error": error_msg}
         
-        # Parse response
-        result = response.json()
-        transcript = result["results"]["channels"][0]["alternatives"][0]["transcript"]
-        
+        # Parse response with a safe walk so a schema hiccup surfaces as a
+        # precise error instead of a KeyError swallowed by the catch-all
+        result = orjson.loads(response.content)
+        alternative = (
+            ((result.get("results") or {}).get("channels") or [{}])[0]
+            .get("alternatives") or [{}]
+        )[0]
+        transcript = alternative.get("transcript", "")
+
+        if not transcript and result.get("err_code"):
+            logger.error(f"Deepgram returned error payload: {result}")
+            return {"text": "", "error": "deepgram: unexpected schema"}
+
         logger.info(f"Transcription successful: {len(transcript)} characters")
-        return {"text": transcript.strip(), "error": None}
+        meta = result.get("metadata") or {}
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Deepgram processed %.1fs of audio (request_id=%s)",
+                meta.get("duration") or 0.0, meta.get("request_id")
+            )
+        transcription = {"text": transcript.strip(), "error": None}
+        if cache_key is not None:
+            _cache.set(cache_key, transcription, expire=7 * 86400)
+        return transcription
     
     except Exception as e:
         logger.error(f"Deepgram transcription error: {str(e)}")
         return {"text": "", "error": f"Transcription failed: {str(e)}"}
 
 
-def evaluate_answer_groq(
-    question: str, 
-    transcript: str, 
+async def stream_transcribe_deepgram(
+    audio_iter: AsyncIterator[bytes],
+    language: str = "en"
+) -> AsyncIterator[str]:
+    """
+    Stream audio to Deepgram's WebSocket API and yield partial transcripts.
+
+    Unlike transcribe_audio_deepgram (upload everything, then wait), this
+    yields text as Deepgram produces it, so the first words appear while
+    the candidate is still speaking. Callers that only need the final
+    transcript should keep using the REST path.
+
+    Args:
+        audio_iter: Async iterator of raw audio chunks (~10 KB each works well)
+        language: Language code (default: "en")
+
+    Yields:
+        str: Partial (interim) and final transcript fragments, in order
+    """
+    if not DEEPGRAM_API_KEY:
+        logger.error("DEEPGRAM_API_KEY not set")
+        return
+
+    import websockets
+
+    url = (
+        "wss://api.deepgram.com/v1/listen"
+        f"?model={DEEPGRAM_MODEL}&language={language}&interim_results=true"
+    )
+
+    try:
+        async with websockets.connect(
+            url,
+            # websockets >= 14 renamed extra_headers to additional_headers
+            additional_headers={"Authorization": f"Token {DEEPGRAM_API_KEY}"}
+        ) as ws:
+
+            async def _producer():
+                async for chunk in audio_iter:
+                    await ws.send(chunk)
+                # Empty frame tells Deepgram the stream is finished
+                await ws.send(b"")
+
+            producer = asyncio.ensure_future(_producer())
+            try:
+                async for message in ws:
+                    data = orjson.loads(message)
+                    alternatives = (
+                        data.get("channel", {}).get("alternatives") or []
+                    )
+                    if alternatives:
+                        transcript = alternatives[0].get("transcript", "")
+                        if transcript:
+                            yield transcript
+            finally:
+                producer.cancel()
+
+    except Exception as e:
+        logger.error(f"Deepgram streaming error: {str(e)}")
+
+
+@cached_llm(ttl_days=30, namespace="groq_eval")
+async def evaluate_answer_groq(
+    question: str,
+    transcript: str,
     role: str = "SDE",
     candidate_name: Optional[str] = None,
     experience_years: Optional[str] = None,
@@ -104,7 +516,19 @@ def evaluate_answer_groq(
         }
     """
     logger.info(f"Evaluating answer with Groq for role={role}, candidate={candidate_name or 'Anonymous'}")
-    
+
+    # Don't spend a 0.5-2s round-trip and tokens on an answer that is
+    # trivially empty (muted mic, "uh", etc.)
+    if len(transcript.strip().split()) < 3:
+        logger.info("Transcript too short to evaluate, skipping Groq call")
+        short_eval = Evaluation.model_validate({
+            "score": 1.0,
+            "reasoning": "The answer was too short to evaluate. Make sure your microphone is working and give a complete answer.",
+            "confidence_assessment": "Low - insufficient speech to assess",
+            "communication_quality": "Insufficient speech to assess"
+        })
+        return {**short_eval.model_dump(), "error": None}
+
     if not GROQ_API_KEY:
         logger.error("GROQ_API_KEY not set")
         return {
@@ -117,8 +541,6 @@ def evaluate_answer_groq(
         }
     
     try:
-        import requests
-        
         # Build candidate profile section
         profile_section = "CANDIDATE PROFILE:\n"
         if candidate_name:
@@ -141,175 +563,45 @@ def evaluate_answer_groq(
             metrics_section += f"- Words Per Minute: {speech_metrics.get('wordsPerMinute', 0)}\n"
             metrics_section += f"- Filler Words: {speech_metrics.get('fillerCount', 0)}\n"
         
-        # Use Groq REST API directly (OpenAI-compatible endpoint)
-        url = "https://api.groq.com/openai/v1/chat/completions"
-        
-        headers = {
-            "Authorization": f"Bearer {GROQ_API_KEY}",
-            "Content-Type": "application/json"
-        }
-        
-        # Construct comprehensive evaluation prompt with enhanced context
-        prompt = f"""You are an expert technical interviewer evaluating a candidate's interview performance.
-
-{profile_section}
-INTERVIEW QUESTION:
-{question}
-
-CANDIDATE'S ANSWER:
-{transcript}
-{metrics_section}
-
-EVALUATION CRITERIA:
-1. Content Quality (40%): Technical accuracy, depth of knowledge, relevance to question
-2. Communication (30%): Clarity, confidence, minimal fumbling/filler words
-3. Visual Presence (20%): Eye contact, posture, professional demeanor
-4. Speech Delivery (10%): Appropriate pacing, minimal filler words
-
-Provide a comprehensive evaluation as JSON with:
-{{
-  "score": <1-10 overall score based on weighted criteria>,
-  "reasoning": "<2-3 sentences explaining the score, highlighting strengths and weaknesses>",
-  "suggestions": [
-    {{
-      "improvement": "<specific, actionable improvement>",
-      "context": "<quote a SHORT phrase from transcript where this applies, or 'General' if applies throughout>",
-      "better_approach": "<suggest what they could say instead or how to improve>"
-    }},
-    {{
-      "improvement": "<specific, actionable improvement>",
-      "context": "<quote a SHORT phrase from transcript where this applies, or 'General' if applies throughout>",
-      "better_approach": "<suggest what they could say instead or how to improve>"
-    }},
-    {{
-      "improvement": "<specific, actionable improvement>",
-      "context": "<quote a SHORT phrase from transcript where this applies, or 'General' if applies throughout>",
-      "better_approach": "<suggest what they could say instead or how to improve>"
-    }}
-  ],
-  "confidence_assessment": "<brief assessment of candidate's confidence level based on speech and visual cues>",
-  "communication_quality": "<brief assessment of communication style and clarity>",
-  "behavioral_insights": {{
-    "eye_contact_analysis": "<analysis of eye contact consistency based on visual metrics>",
-    "filler_word_impact": "<how filler words affected the delivery>",
-    "speech_pace_feedback": "<feedback on speaking pace based on WPM>"
-  }}
-}}
+        # Fill the precompiled template; sections are normalized (no trailing
+        # whitespace) so equal inputs produce byte-identical prompts
+        prompt = _EVAL_PROMPT_TMPL.substitute(
+            profile_section=profile_section.rstrip("\n"),
+            question=question,
+            transcript=transcript,
+            metrics_section=metrics_section.rstrip("\n")
+        )
 
-Respond ONLY with valid JSON, no other text."""
+        # Call Groq API (cached by prompt hash, JSON mode guarantees
+        # parseable output, static rubric rides in the system message)
+        chat = await _groq_chat(
+            prompt, temperature=0.3, max_tokens=600, json_response=True,
+            system=_EVAL_SYSTEM_PROMPT
+        )
 
-        payload = {
-            "model": "llama-3.3-70b-versatile",  # Updated to active model
-            "messages": [
-                {
-                    "role": "user",
-                    "content": prompt
-                }
-            ],
-            "temperature": 0.3,
-            "max_tokens": 600
-        }
-        
-        # Call Groq API
-        response = requests.post(url, headers=headers, json=payload, timeout=60)
-        
-        if response.status_code != 200:
-            error_msg = f"Groq API error: {response.status_code}"
-            logger.error(f"{error_msg} - {response.text}")
+        if chat["error"]:
             return {
                 "score": 0,
                 "reasoning": "Evaluation failed",
                 "suggestions": [],
                 "confidence_assessment": "Unable to assess",
                 "communication_quality": "Unable to assess",
-                "error": error_msg
+                "error": chat["error"]
             }
-        
-        # Extract response
-        result = response.json()
-        response_text = result["choices"][0]["message"]["content"].strip()
-        
-        # Parse JSON
-        # Clean up response - remove markdown code blocks if present
-        if "```json" in response_text:
-            response_text = response_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in response_text:
-            response_text = response_text.split("```")[1].split("```")[0].strip()
-        
-        # Try to find JSON in the response
-        start_idx = response_text.find("{")
-        end_idx = response_text.rfind("}") + 1
-        
-        if start_idx != -1 and end_idx > start_idx:
-            json_str = response_text[start_idx:end_idx]
-            evaluation = json.loads(json_str)
-        else:
-            evaluation = json.loads(response_text)
-        
-        # Validate and normalize response
-        score = float(evaluation.get("score", 5))
-        score = max(1.0, min(10.0, score))  # Clamp to 1-10
-        
-        reasoning = evaluation.get("reasoning", "No reasoning provided")
-        if not isinstance(reasoning, str):
-            reasoning = str(reasoning)
-        
-        suggestions = evaluation.get("suggestions", [])
-        if not isinstance(suggestions, list):
-            suggestions = [str(suggestions)]
-        
-        # Normalize suggestions to enhanced format
-        normalized_suggestions = []
-        for sug in suggestions[:3]:  # Limit to 3 suggestions
-            if isinstance(sug, dict):
-                # Already in enhanced format
-                normalized_suggestions.append({
-                    "improvement": sug.get("improvement", "Continue practicing"),
-                    "context": sug.get("context", "General"),
-                    "better_approach": sug.get("better_approach", "")
-                })
-            else:
-                # Old format (simple string) - convert to enhanced format
-                normalized_suggestions.append({
-                    "improvement": str(sug),
-                    "context": "General",
-                    "better_approach": ""
-                })
-        
-        # Ensure exactly 3 suggestions
-        while len(normalized_suggestions) < 3:
-            normalized_suggestions.append({
-                "improvement": "Continue practicing interview questions",
-                "context": "General",
-                "better_approach": "Practice with a variety of question types"
-            })
-        
-        confidence_assessment = evaluation.get("confidence_assessment", "Moderate confidence displayed")
-        communication_quality = evaluation.get("communication_quality", "Clear communication")
-        
-        # Extract behavioral insights
-        behavioral_insights = evaluation.get("behavioral_insights", {})
-        if not isinstance(behavioral_insights, dict):
-            behavioral_insights = {}
-        
-        logger.info(f"Evaluation successful: score={score}")
-        return {
-            "score": score,
-            "reasoning": reasoning,
-            "suggestions": normalized_suggestions,
-            "confidence_assessment": confidence_assessment,
-            "communication_quality": communication_quality,
-            "behavioral_insights": {
-                "eye_contact_analysis": behavioral_insights.get("eye_contact_analysis", ""),
-                "filler_word_impact": behavioral_insights.get("filler_word_impact", ""),
-                "speech_pace_feedback": behavioral_insights.get("speech_pace_feedback", "")
-            },
-            "error": None
-        }
+
+        response_text = chat["text"]
+
+        # Parse JSON (single regex pass + orjson, tolerant of markdown fences)
+        # and normalize through the compiled pydantic schema
+        evaluation = Evaluation.model_validate(_extract_json(response_text))
+
+        logger.info(f"Evaluation successful: score={evaluation.score}")
+        return {**evaluation.model_dump(), "error": None}
     
     except json.JSONDecodeError as e:
         logger.error(f"Failed to parse JSON from Groq response: {e}")
-        logger.debug(f"Raw response: {response_text[:500]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Raw response: %.500s", response_text)
         
         # Fallback: Return a basic evaluation
         return {
@@ -333,7 +625,139 @@ Respond ONLY with valid JSON, no other text."""
         }
 
 
-def generate_dynamic_questions(
+async def evaluate_answers_batch(items: list) -> list:
+    """
+    Evaluate several (question, transcript) pairs in one Groq call.
+
+    Packs up to 5 pairs per request so per-call network latency and model
+    startup are amortized across answers instead of paid N times.
+
+    Args:
+        items: list of dicts with "question", "transcript" and optional "role"
+
+    Returns:
+        list[dict]: one {"score", "reasoning", "suggestions", "error"} per item,
+        in the same order as the input
+    """
+    if not items:
+        return []
+
+    logger.info(f"Evaluating {len(items)} answers in batch with Groq")
+
+    if not GROQ_API_KEY:
+        logger.error("GROQ_API_KEY not set")
+        return [{"score": 0, "reasoning": "Groq API key not configured",
+                 "suggestions": [], "error": "API key missing"} for _ in items]
+
+    # Stay within the output-token budget per request
+    if len(items) > 5:
+        results = []
+        for i in range(0, len(items), 5):
+            results.extend(await evaluate_answers_batch(items[i:i + 5]))
+        return results
+
+    try:
+        pairs_section = ""
+        for idx, item in enumerate(items, start=1):
+            pairs_section += f"""
+PAIR {idx}:
+Role: {item.get('role', 'General')}
+Question: {item.get('question', '')}
+Answer: {item.get('transcript', '')}
+"""
+
+        prompt = f"""You are an expert technical interviewer. Evaluate the following {len(items)} interview question/answer pairs.
+{pairs_section}
+For EACH pair, in the same order, provide:
+1. "score": a number from 1-10 based on clarity, technical depth, and relevance
+2. "reasoning": a 2-3 sentence explanation of the score
+3. "suggestions": an array of exactly 3 specific improvement suggestions
+
+Respond with ONLY a valid JSON array of {len(items)} objects, no other text."""
+
+        chat = await _groq_chat(prompt, temperature=0.3, max_tokens=150 * len(items) + 150)
+
+        if chat["error"]:
+            return [{"score": 0, "reasoning": "Evaluation failed",
+                     "suggestions": [], "error": chat["error"]} for _ in items]
+
+        response_text = chat["text"]
+
+        # Extract the JSON array
+        evaluations = _extract_json(response_text, array=True)
+
+        if not isinstance(evaluations, list):
+            evaluations = [evaluations]
+
+        # The model occasionally drops or merges items; when the array
+        # length is off, re-run those pairs individually rather than
+        # returning placeholder errors
+        if len(evaluations) != len(items):
+            logger.warning(
+                f"Batch returned {len(evaluations)} evaluations for {len(items)} items, "
+                "falling back to per-item calls"
+            )
+            return list(await asyncio.gather(*[
+                evaluate_answer_groq(
+                    question=item.get("question", ""),
+                    transcript=item.get("transcript", ""),
+                    role=item.get("role", "General")
+                )
+                for item in items
+            ]))
+
+        results = []
+        for idx in range(len(items)):
+            if not isinstance(evaluations[idx], dict):
+                results.append({"score": 0, "reasoning": "Evaluation missing from batch response",
+                                "suggestions": [], "error": "Incomplete batch response"})
+                continue
+
+            evaluation = evaluations[idx]
+            score = float(evaluation.get("score", 5))
+            score = max(1.0, min(10.0, score))  # Clamp to 1-10
+
+            suggestions = evaluation.get("suggestions", [])
+            if not isinstance(suggestions, list):
+                suggestions = [str(suggestions)]
+
+            results.append({
+                "score": score,
+                "reasoning": str(evaluation.get("reasoning", "No reasoning provided")),
+                "suggestions": [str(s) for s in suggestions[:3]],
+                "error": None
+            })
+
+        logger.info(f"Batch evaluation successful: {len(results)} answers scored")
+        return results
+
+    except json.JSONDecodeError as e:
+        logger.error(f"Failed to parse batch evaluation JSON: {e}")
+        return [{"score": 0, "reasoning": "Evaluation failed",
+                 "suggestions": [], "error": "Failed to parse evaluation response"} for _ in items]
+
+    except Exception as e:
+        logger.error(f"Batch evaluation error: {str(e)}")
+        return [{"score": 0, "reasoning": "Evaluation failed",
+                 "suggestions": [], "error": f"Groq API error: {str(e)}"} for _ in items]
+
+
+def _exp_bucket(experience_years: Optional[str]) -> str:
+    """Bucket years of experience so near-identical profiles share a cache key"""
+    try:
+        years = int(experience_years)
+    except (TypeError, ValueError):
+        return "any"
+    if years <= 1:
+        return "0-1"
+    if years <= 3:
+        return "2-3"
+    if years <= 6:
+        return "4-6"
+    return "7+"
+
+
+async def generate_dynamic_questions(
     role: str,
     experience_years: Optional[str] = None,
     skills: Optional[list] = None,
@@ -364,10 +788,24 @@ def generate_dynamic_questions(
             "questions": [],
             "error": "API key not configured"
         }
-    
+
+    # (role, experience bucket, skills set, difficulty) tuples repeat heavily
+    # across users, so question sets are cached on disk under a canonical
+    # key. Up to 3 generated sets accumulate per key and hits pick one at
+    # random, keeping some variety without paying Groq for every request.
+    cache_key = "groq_questions:" + "|".join((
+        role.lower().strip(),
+        _exp_bucket(experience_years),
+        ",".join(sorted(s.lower().strip() for s in skills or [])),
+        (difficulty or "").lower(),
+        str(num_questions),
+    ))
+    cached_sets = _cache.get(cache_key) or []
+    if len(cached_sets) >= 3:
+        logger.info("Question set served from cache")
+        return {"questions": random.choice(cached_sets), "error": None}
+
     try:
-        import requests
-        
         # Build context
         context = f"Role: {role}\n"
         if experience_years:
@@ -423,48 +861,24 @@ Respond with ONLY valid JSON in this format:
   ]
 }}"""
 
-        url = "https://api.groq.com/openai/v1/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {GROQ_API_KEY}",
-            "Content-Type": "application/json"
-        }
-        
-        payload = {
-            "model": "llama-3.3-70b-versatile",
-            "messages": [{"role": "user", "content": prompt}],
-            "temperature": 0.7,
-            "max_tokens": 800
-        }
-        
-        response = requests.post(url, headers=headers, json=payload, timeout=60)
-        
-        if response.status_code != 200:
-            error_msg = f"Groq API error: {response.status_code}"
-            logger.error(f"{error_msg} - {response.text}")
-            return {"questions": [], "error": error_msg}
-        
-        result = response.json()
-        response_text = result["choices"][0]["message"]["content"].strip()
-        
-        # Clean up response
-        if "```json" in response_text:
-            response_text = response_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in response_text:
-            response_text = response_text.split("```")[1].split("```")[0].strip()
-        
+        # temperature 0.7 keeps generation varied, so these calls bypass the cache
+        chat = await _groq_chat(prompt, temperature=0.7, max_tokens=800)
+
+        if chat["error"]:
+            return {"questions": [], "error": chat["error"]}
+
+        response_text = chat["text"]
+
         # Extract JSON
-        start_idx = response_text.find("{")
-        end_idx = response_text.rfind("}") + 1
-        
-        if start_idx != -1 and end_idx > start_idx:
-            json_str = response_text[start_idx:end_idx]
-            data = json.loads(json_str)
-        else:
-            data = json.loads(response_text)
+        data = _extract_json(response_text)
         
         questions = data.get("questions", [])
         logger.info(f"Generated {len(questions)} questions successfully")
-        
+
+        if questions:
+            cached_sets.append(questions)
+            _cache.set(cache_key, cached_sets[-3:], expire=86400)
+
         return {
             "questions": questions,
             "error": None
@@ -481,27 +895,25 @@ Respond with ONLY valid JSON in this format:
 def test_groq_connection() -> tuple[bool, str]:
     """
     Test Groq API connection and token validity.
-    
+
     Returns:
         tuple: (success: bool, message: str)
     """
     if not GROQ_API_KEY:
         return False, "GROQ_API_KEY not set"
-    
+
     try:
-        from groq import Groq
-        
-        client = Groq(api_key=GROQ_API_KEY)
-        
-        # Test with a simple completion
-        response = client.chat.completions.create(
-            messages=[{"role": "user", "content": "Hello"}],
-            model="llama-3.1-70b-versatile",
-            max_tokens=10,
+        # Listing models is a cheap key-validating GET — no SDK import,
+        # no paid completion tokens
+        response = httpx.get(
+            "https://api.groq.com/openai/v1/models",
+            headers={"Authorization": f"Bearer {GROQ_API_KEY}"},
+            timeout=10
         )
-        
-        return True, "Groq API connection successful"
-    
+        if response.status_code == 200:
+            return True, "Groq API connection successful"
+        return False, f"Groq connection test failed: HTTP {response.status_code}"
+
     except Exception as e:
         return False, f"Groq connection test failed: {str(e)}"
 
@@ -509,26 +921,29 @@ def test_groq_connection() -> tuple[bool, str]:
 def test_deepgram_connection() -> tuple[bool, str]:
     """
     Test Deepgram API connection.
-    
+
     Returns:
         tuple: (success: bool, message: str)
     """
     if not DEEPGRAM_API_KEY:
         return False, "DEEPGRAM_API_KEY not set"
-    
+
     try:
-        from deepgram import DeepgramClient
-        
-        # Just check if we can initialize the client
-        deepgram = DeepgramClient(DEEPGRAM_API_KEY)
-        
-        return True, "Deepgram API key configured"
-    
+        response = httpx.get(
+            "https://api.deepgram.com/v1/projects",
+            headers={"Authorization": f"Token {DEEPGRAM_API_KEY}"},
+            timeout=10
+        )
+        if response.status_code == 200:
+            return True, "Deepgram API key valid"
+        return False, f"Deepgram connection test failed: HTTP {response.status_code}"
+
     except Exception as e:
         return False, f"Deepgram test failed: {str(e)}"
 
 
-def analyze_transcript_linewise(
+@cached_llm(ttl_days=30, namespace="groq_linewise")
+async def analyze_transcript_linewise(
     transcript: str,
     question: str,
     role: str = "candidate"
@@ -558,8 +973,6 @@ def analyze_transcript_linewise(
         return {"lineAnalysis": [], "error": "Transcript too short to analyze"}
     
     try:
-        import requests
-        
         prompt = f"""Analyze this interview answer sentence by sentence.
 
 QUESTION: {question}
@@ -594,44 +1007,18 @@ Respond with ONLY valid JSON in this format:
 
 Analyze AT MOST 5 sentences. Choose the most impactful ones."""
 
-        url = "https://api.groq.com/openai/v1/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {GROQ_API_KEY}",
-            "Content-Type": "application/json"
-        }
-        
-        payload = {
-            "model": "llama-3.3-70b-versatile",
-            "messages": [{"role": "user", "content": prompt}],
-            "temperature": 0.3,
-            "max_tokens": 1000
-        }
-        
-        response = requests.post(url, headers=headers, json=payload, timeout=60)
-        
-        if response.status_code != 200:
-            error_msg = f"Groq API error: {response.status_code}"
-            logger.error(f"{error_msg} - {response.text}")
-            return {"lineAnalysis": [], "error": error_msg}
-        
-        result = response.json()
-        response_text = result["choices"][0]["message"]["content"].strip()
-        
-        # Clean up response - remove markdown code blocks if present
-        if "```json" in response_text:
-            response_text = response_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in response_text:
-            response_text = response_text.split("```")[1].split("```")[0].strip()
-        
+        chat = await _groq_chat(
+            prompt, model=GROQ_FAST_MODEL, temperature=0.3, max_tokens=1000,
+            json_response=True
+        )
+
+        if chat["error"]:
+            return {"lineAnalysis": [], "error": chat["error"]}
+
+        response_text = chat["text"]
+
         # Extract JSON
-        start_idx = response_text.find("{")
-        end_idx = response_text.rfind("}") + 1
-        
-        if start_idx != -1 and end_idx > start_idx:
-            json_str = response_text[start_idx:end_idx]
-            analysis = json.loads(json_str)
-        else:
-            analysis = json.loads(response_text)
+        analysis = _extract_json(response_text)
         
         line_analysis = analysis.get("lineAnalysis", [])
         
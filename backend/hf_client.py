@@ -4,18 +4,33 @@ Handles speech-to-text transcription and answer evaluation using HF models.
 """
 
 import os
-import time
-import json
+import asyncio
 import logging
-import requests
+import random
+import string
 from typing import Optional
 
+import httpx
+import orjson
+from pydantic import BaseModel, Field, field_validator
+
+from groq_deepgram_client import _extract_json
+from llm_cache import cached_llm
+
 logger = logging.getLogger(__name__)
 
 # HF API Configuration
 HF_API_BASE = "https://api-inference.huggingface.co/models"
 HF_API_TOKEN = os.getenv("HUGGINGFACE_API_TOKEN", "")
 
+# Shared async HTTP client (pooled, keep-alive) so concurrent HF calls
+# overlap on the event loop instead of blocking a worker each.
+_CLIENT = httpx.AsyncClient(
+    http2=True,
+    timeout=httpx.Timeout(60.0),
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+)
+
 # Model Configuration (can be overridden via env vars)
 # Using models confirmed to work on HF free tier
 ASR_MODEL = os.getenv("HF_ASR_MODEL", "facebook/wav2vec2-base-960h")  # Alternative to Whisper
@@ -24,92 +39,150 @@ LLM_MODEL = os.getenv("HF_LLM_MODEL", "google/flan-t5-base")  # Smaller, free-ti
 # Retry Configuration
 MAX_RETRIES = 3
 INITIAL_BACKOFF = 1.0  # seconds
+MAX_BACKOFF = 30.0  # seconds, cap for exponential backoff
 MAX_WAIT_TIME = 60.0  # seconds for model loading
 
+_DEFAULT_SUGGESTIONS = (
+    "Continue practicing interview questions",
+    "Provide more specific examples",
+    "Structure your answer more clearly",
+)
+
+
+class HFEvaluation(BaseModel):
+    """Normalized shape of an HF evaluation response.
+
+    Clamping, coercion and suggestion padding all run in pydantic's
+    compiled core instead of hand-rolled isinstance checks.
+    """
+    score: float = 5
+    reasoning: str = "No reasoning provided"
+    suggestions: list = Field(default_factory=list, validate_default=True)
+
+    @field_validator("score")
+    @classmethod
+    def _clamp_score(cls, v: float) -> float:
+        return max(1.0, min(10.0, v))
+
+    @field_validator("reasoning", mode="before")
+    @classmethod
+    def _coerce_reasoning(cls, v):
+        return v if isinstance(v, str) else str(v)
 
-def _make_hf_request(
+    @field_validator("suggestions", mode="before")
+    @classmethod
+    def _normalize_suggestions(cls, v):
+        if not isinstance(v, list):
+            v = [str(v)]
+        # Pad-and-truncate in one slice instead of an append loop
+        return ([str(s) for s in v[:3]] + list(_DEFAULT_SUGGESTIONS))[:3]
+
+
+# Evaluation prompt compiled once at import; only the dynamic slots vary
+# per call (same convention as the Groq client's template)
+_EVAL_PROMPT_TMPL = string.Template("""<s>[INST] You are an expert technical interviewer evaluating a candidate's answer.
+
+Role: $role
+Question: $question
+
+Candidate's Answer:
+$transcript
+
+Evaluate this answer and provide a JSON response with:
+1. "score": A number from 1-10 based on clarity, technical depth, and relevance
+2. "reasoning": A 2-3 sentence explanation of the score
+3. "suggestions": An array of exactly 3 specific improvement suggestions
+
+Respond ONLY with valid JSON, no other text.
+[/INST]""")
+
+# Cap in-flight HF requests so parallel callers don't trip rate limits,
+# and jitter retries so they don't re-synchronize after a shared 429
+_HF_SEM = asyncio.Semaphore(int(os.getenv("HF_MAX_CONCURRENCY", "8")))
+
+
+async def _make_hf_request(
     model: str,
     payload: dict = None,
     files: dict = None,
-    timeout: int = 30,
-    retry_count: int = 0
+    timeout: int = 30
 ) -> dict:
     """
     Make a request to HF Inference API with retry logic.
-    
+
     Args:
         model: HF model identifier
         payload: JSON payload for text generation
         files: File payload for audio/image models
         timeout: Request timeout in seconds
-        retry_count: Current retry attempt
-        
+
     Returns:
         dict: API response or error dict
     """
     if not HF_API_TOKEN:
         logger.error("HUGGINGFACE_API_TOKEN not set")
         return {"error": "HF API token not configured"}
-    
+
     url = f"{HF_API_BASE}/{model}"
     headers = {"Authorization": f"Bearer {HF_API_TOKEN}"}
-    
+
     try:
-        if files:
-            response = requests.post(url, headers=headers, files=files, timeout=timeout)
-        else:
-            headers["Content-Type"] = "application/json"
-            response = requests.post(url, headers=headers, json=payload, timeout=timeout)
-        
-        # Handle rate limiting (429)
-        if response.status_code == 429:
-            if retry_count < MAX_RETRIES:
-                backoff = INITIAL_BACKOFF * (2 ** retry_count)
-                logger.warning(f"Rate limited (429). Retrying in {backoff}s... (attempt {retry_count + 1}/{MAX_RETRIES})")
-                time.sleep(backoff)
-                return _make_hf_request(model, payload, files, timeout, retry_count + 1)
-            else:
-                logger.error("Max retries exceeded for rate limiting")
-                return {"error": "Rate limit exceeded. Please try again later."}
-        
-        # Handle model loading (503)
-        if response.status_code == 503:
-            try:
-                error_data = response.json()
-                estimated_time = error_data.get("estimated_time", 20)
-            except:
-                estimated_time = 20
-            
-            if retry_count < MAX_RETRIES and estimated_time < MAX_WAIT_TIME:
-                wait_time = min(estimated_time + 2, MAX_WAIT_TIME)
-                logger.info(f"Model loading (503). Waiting {wait_time}s... (attempt {retry_count + 1}/{MAX_RETRIES})")
-                time.sleep(wait_time)
-                return _make_hf_request(model, payload, files, timeout, retry_count + 1)
-            else:
-                logger.error("Model loading timeout or max retries exceeded")
-                return {"error": f"Model is loading. Please try again in {estimated_time}s."}
-        
-        # Handle other errors
-        if response.status_code != 200:
-            logger.error(f"HF API error {response.status_code}: {response.text}")
-            return {"error": f"API error: {response.status_code}"}
-        
-        return response.json()
-    
-    except requests.exceptions.Timeout:
+        for attempt in range(MAX_RETRIES + 1):
+            async with _HF_SEM:
+                if files:
+                    response = await _CLIENT.post(url, headers=headers, files=files, timeout=timeout)
+                else:
+                    headers["Content-Type"] = "application/json"
+                    response = await _CLIENT.post(url, headers=headers, content=orjson.dumps(payload), timeout=timeout)
+
+            # Handle rate limiting (429)
+            if response.status_code == 429:
+                if attempt >= MAX_RETRIES:
+                    logger.error("Max retries exceeded for rate limiting")
+                    return {"error": "Rate limit exceeded. Please try again later."}
+                # Full jitter: uniform in (0.5x, 1.5x) of the exponential step
+                delay = min(INITIAL_BACKOFF * (2 ** attempt), MAX_BACKOFF) * (0.5 + random.random())
+                logger.warning(f"Rate limited (429). Retrying in {delay:.1f}s... (attempt {attempt + 1}/{MAX_RETRIES})")
+                await asyncio.sleep(delay)
+                continue
+
+            # Handle model loading (503)
+            if response.status_code == 503:
+                try:
+                    error_data = orjson.loads(response.content)
+                    estimated_time = error_data.get("estimated_time", 20)
+                except:
+                    estimated_time = 20
+
+                if attempt >= MAX_RETRIES or estimated_time >= MAX_WAIT_TIME:
+                    logger.error("Model loading timeout or max retries exceeded")
+                    return {"error": f"Model is loading. Please try again in {estimated_time}s."}
+                wait_time = min(estimated_time + 2, MAX_WAIT_TIME) * (0.5 + random.random())
+                logger.info(f"Model loading (503). Waiting {wait_time:.1f}s... (attempt {attempt + 1}/{MAX_RETRIES})")
+                await asyncio.sleep(wait_time)
+                continue
+
+            # Handle other errors
+            if response.status_code != 200:
+                logger.error(f"HF API error {response.status_code}: {response.text}")
+                return {"error": f"API error: {response.status_code}"}
+
+            return orjson.loads(response.content)
+
+    except httpx.TimeoutException:
         logger.error(f"Request timeout after {timeout}s")
         return {"error": "Request timeout. Model may be overloaded."}
-    
-    except requests.exceptions.RequestException as e:
+
+    except httpx.HTTPError as e:
         logger.error(f"Request failed: {str(e)}")
         return {"error": f"Network error: {str(e)}"}
-    
+
     except Exception as e:
         logger.error(f"Unexpected error: {str(e)}")
         return {"error": f"Unexpected error: {str(e)}"}
 
 
-def transcribe_audio_bytes(audio_bytes: bytes, language: str = "en") -> dict:
+async def transcribe_audio_bytes(audio_bytes: bytes, language: str = "en") -> dict:
     """
     Transcribe audio using HF Whisper model.
     
@@ -124,7 +197,7 @@ def transcribe_audio_bytes(audio_bytes: bytes, language: str = "en") -> dict:
     
     files = {"file": ("audio.wav", audio_bytes, "audio/wav")}
     
-    result = _make_hf_request(ASR_MODEL, files=files, timeout=60)
+    result = await _make_hf_request(ASR_MODEL, files=files, timeout=60)
     
     if "error" in result:
         logger.error(f"Transcription failed: {result['error']}")
@@ -143,7 +216,8 @@ def transcribe_audio_bytes(audio_bytes: bytes, language: str = "en") -> dict:
     return {"text": text.strip(), "error": None}
 
 
-def evaluate_answer(question: str, transcript: str, role: str = "SDE") -> dict:
+@cached_llm(ttl_days=30, namespace="hf_eval")
+async def evaluate_answer(question: str, transcript: str, role: str = "SDE") -> dict:
     """
     Evaluate interview answer using HF LLM.
     
@@ -161,23 +235,12 @@ def evaluate_answer(question: str, transcript: str, role: str = "SDE") -> dict:
         }
     """
     logger.info(f"Evaluating answer for role={role}, question length={len(question)}, transcript length={len(transcript)}")
-    
-    # Construct prompt for structured evaluation
-    prompt = f"""<s>[INST] You are an expert technical interviewer evaluating a candidate's answer.
-
-Role: {role}
-Question: {question}
-
-Candidate's Answer:
-{transcript}
 
-Evaluate this answer and provide a JSON response with:
-1. "score": A number from 1-10 based on clarity, technical depth, and relevance
-2. "reasoning": A 2-3 sentence explanation of the score
-3. "suggestions": An array of exactly 3 specific improvement suggestions
-
-Respond ONLY with valid JSON, no other text.
-[/INST]"""
+    # Fill the precompiled template (static ~90% of the prompt is parsed once
+    # at import; only the dynamic spans are copied per call)
+    prompt = _EVAL_PROMPT_TMPL.substitute(
+        role=role, question=question, transcript=transcript
+    )
 
     payload = {
         "inputs": prompt,
@@ -189,7 +252,7 @@ Respond ONLY with valid JSON, no other text.
         }
     }
     
-    result = _make_hf_request(LLM_MODEL, payload=payload, timeout=45)
+    result = await _make_hf_request(LLM_MODEL, payload=payload, timeout=45)
     
     if "error" in result:
         logger.error(f"Evaluation failed: {result['error']}")
@@ -210,53 +273,19 @@ Respond ONLY with valid JSON, no other text.
         else:
             raise ValueError(f"Unexpected response format: {result}")
         
-        # Clean up response - remove markdown code blocks if present
+        # Pull the JSON object out of the model output (handles fenced
+        # code blocks and surrounding prose in one precompiled-regex pass),
+        # then let pydantic clamp/coerce/pad in a single validation pass
         generated_text = generated_text.strip()
-        if "```json" in generated_text:
-            generated_text = generated_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in generated_text:
-            generated_text = generated_text.split("```")[1].split("```")[0].strip()
-        
-        # Try to find JSON in the response
-        # Sometimes models add text before/after JSON
-        start_idx = generated_text.find("{")
-        end_idx = generated_text.rfind("}") + 1
-        
-        if start_idx != -1 and end_idx > start_idx:
-            json_str = generated_text[start_idx:end_idx]
-            evaluation = json.loads(json_str)
-        else:
-            # Fallback: try parsing entire response
-            evaluation = json.loads(generated_text)
-        
-        # Validate and normalize response
-        score = float(evaluation.get("score", 5))
-        score = max(1.0, min(10.0, score))  # Clamp to 1-10
-        
-        reasoning = evaluation.get("reasoning", "No reasoning provided")
-        if not isinstance(reasoning, str):
-            reasoning = str(reasoning)
-        
-        suggestions = evaluation.get("suggestions", [])
-        if not isinstance(suggestions, list):
-            suggestions = [str(suggestions)]
-        
-        # Ensure exactly 3 suggestions
-        while len(suggestions) < 3:
-            suggestions.append("Continue practicing interview questions")
-        suggestions = suggestions[:3]
-        
-        logger.info(f"Evaluation successful: score={score}")
-        return {
-            "score": score,
-            "reasoning": reasoning,
-            "suggestions": suggestions,
-            "error": None
-        }
+        evaluation = HFEvaluation.model_validate(_extract_json(generated_text))
+
+        logger.info(f"Evaluation successful: score={evaluation.score}")
+        return {**evaluation.model_dump(), "error": None}
     
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         logger.error(f"Failed to parse JSON from LLM response: {e}")
-        logger.debug(f"Raw response: {generated_text[:500]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Raw response: %.500s", generated_text)
         
         # Fallback: Return a basic evaluation
         return {
@@ -280,7 +309,7 @@ Respond ONLY with valid JSON, no other text.
         }
 
 
-def test_hf_connection() -> tuple[bool, str]:
+async def test_hf_connection() -> tuple[bool, str]:
     """
     Test HF API connection and token validity.
     
@@ -297,7 +326,7 @@ def test_hf_connection() -> tuple[bool, str]:
             "parameters": {"max_new_tokens": 10}
         }
         
-        result = _make_hf_request(LLM_MODEL, payload=test_payload, timeout=30)
+        result = await _make_hf_request(LLM_MODEL, payload=test_payload, timeout=30)
         
         if "error" in result:
             return False, f"API Error: {result['error']}"
@@ -1,7 +1,12 @@
 import google.generativeai as genai
+import asyncio
+import functools
 import os
 import logging
-import json
+import threading
+
+import orjson
+from pydantic import BaseModel, field_validator
 
 logger = logging.getLogger(__name__)
 
@@ -11,9 +16,63 @@ logger = logging.getLogger(__name__)
 from dotenv import load_dotenv
 from pathlib import Path
 
+from llm_cache import cached_llm
+
 env_path = Path(__file__).parent / ".env"
 load_dotenv(dotenv_path=env_path, encoding="utf-8")
 
+
+class ContentAnalysis(BaseModel):
+    """Normalized shape of the Gemini content analysis response"""
+    score: int = 0
+    feedback: str = ""
+    completeness: int = 0
+
+    @field_validator("score", "completeness")
+    @classmethod
+    def _clamp_percent(cls, v: int) -> int:
+        return max(0, min(100, v))
+
+
+# Static instruction preamble sent once per process via the chat history;
+# per-call messages carry only the transcript and question id
+_SYSTEM_PROMPT = """You are an expert interview coach. For every candidate answer transcript
+you receive, assume a standard behavioral/technical interview question and
+reply with ONLY a JSON object:
+1. "score": Integrity (0-100) based on clarity, relevance, and depth.
+2. "feedback": A concise (1-2 sentences) constructive tip.
+3. "completeness": (0-100) Did they answer fully?"""
+
+
+@functools.lru_cache(maxsize=1)
+def _gemini_model():
+    """Configure genai once and reuse the model across calls"""
+    genai.configure(api_key=os.environ["GEMINI_API_KEY"])
+    # Using gemini-1.5-flash as it is stable and working
+    return genai.GenerativeModel('gemini-1.5-flash')
+
+
+@functools.lru_cache(maxsize=1)
+def _analysis_chat():
+    """One chat session per process holding the instruction preamble.
+
+    Per-call messages then only carry the transcript, so the repeated
+    instruction tokens are sent (and billed) once instead of per request.
+    """
+    return _gemini_model().start_chat(history=[
+        {"role": "user", "parts": [_SYSTEM_PROMPT]},
+        {"role": "model", "parts": ["Understood."]},
+    ])
+
+
+# The shared chat's history is mutated on every call (send_message, then
+# the preamble trim), and aanalyze_content_with_llm runs this on worker
+# threads — serialize access so concurrent analyses can't interleave
+# their transcripts into each other's context
+_analysis_chat_lock = threading.Lock()
+
+
+@cached_llm(ttl_days=30, namespace="gemini_analysis")
 def analyze_content_with_llm(transcript: str, question_id: str):
     """
     Analyze the interview answer using Gemini.
@@ -26,43 +85,43 @@ def analyze_content_with_llm(transcript: str, question_id: str):
         return {
             "score": 0,
             "feedback": "API Key missing. Content analysis disabled.",
-            "completeness": 0
+            "completeness": 0,
+            "error": "API Key missing"
         }
     
     try:
-        genai.configure(api_key=api_key)
-        # Using gemini-1.5-flash as it is stable and working
-        model = genai.GenerativeModel('gemini-1.5-flash')
-        
         # Context could be improved by having the actual question text passed in.
-        prompt = f"""
-        You are an expert interview coach. Analyze the following candidate answer transcript.
-        
-        Transcript: "{transcript}"
-        Question ID Context: {question_id} (Assume standard behavioral/technical interview question)
-        
-        Provide a JSON response with:
-        1. "score": Integrity (0-100) based on clarity, relevance, and depth.
-        2. "feedback": A concise (1-2 sentences) constructive tip.
-        3. "completeness": (0-100) Did they answer fully?
-        
-        JSON Format only.
-        """
-        
-        response = model.generate_content(prompt)
+        with _analysis_chat_lock:
+            chat = _analysis_chat()
+            response = chat.send_message(
+                f'Transcript: "{transcript}"\nQuestion ID Context: {question_id}'
+            )
+            # Keep only the instruction preamble; earlier transcripts must
+            # not leak into (or grow the token cost of) later analyses
+            del chat.history[2:]
         text_resp = response.text.replace("```json", "").replace("```", "").strip()
         
-        data = json.loads(text_resp)
-        return data
+        return ContentAnalysis.model_validate(orjson.loads(text_resp)).model_dump()
 
     except Exception as e:
         logger.error(f"LLM Error: {e}")
+        # "error" must be set so cached_llm never disk-caches a transient
+        # failure for the full TTL
         return {
             "score": 0,
             "feedback": f"Error: {str(e)}",
-            "completeness": 0
+            "completeness": 0,
+            "error": str(e)
         }
 
+async def aanalyze_content_with_llm(transcript: str, question_id: str):
+    """
+    Async wrapper so the Gemini call can be gathered alongside other LLM
+    calls without blocking the event loop.
+    """
+    return await asyncio.to_thread(analyze_content_with_llm, transcript, question_id)
+
+
 def test_api_connection():
     """
     Simple test to verify Gemini API connection.
@@ -0,0 +1,86 @@
+"""
+Persistent LLM Result Cache
+Disk-backed (SQLite via diskcache) memoization for the expensive evaluator
+calls. Identical (model, role, question, transcript, prompt version) inputs
+skip the 2-8s API round-trip entirely across process restarts.
+"""
+
+import functools
+import hashlib
+import inspect
+import logging
+import os
+
+import diskcache
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever a prompt template changes so stale evaluations are not reused
+PROMPT_VERSION = 2
+
+CACHE_DIR = os.getenv(
+    "LLM_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "ai-mock-interview"),
+)
+
+_cache = diskcache.Cache(CACHE_DIR)
+
+
+def _cache_key(namespace: str, bound: dict) -> str:
+    """SHA256 over the normalized call arguments plus the prompt version."""
+    payload = {"ns": namespace, "v": PROMPT_VERSION, "args": bound}
+    digest = hashlib.sha256(
+        orjson.dumps(payload, option=orjson.OPT_SORT_KEYS, default=str)
+    ).hexdigest()
+    return f"{namespace}:{digest}"
+
+
+def cached_llm(ttl_days: int = 30, namespace: str = "llm"):
+    """
+    Decorator memoizing an LLM evaluator on disk.
+
+    Works on both sync and async functions. Results carrying a truthy
+    "error" key are never cached so transient API failures can retry.
+    """
+    ttl = ttl_days * 86400
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        def _key(args, kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return _cache_key(namespace, dict(bound.arguments))
+
+        def _cacheable(result) -> bool:
+            return not (isinstance(result, dict) and result.get("error"))
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                key = _key(args, kwargs)
+                hit = _cache.get(key)
+                if hit is not None:
+                    logger.info(f"LLM cache hit ({namespace})")
+                    return hit
+                result = await func(*args, **kwargs)
+                if _cacheable(result):
+                    _cache.set(key, result, expire=ttl)
+                return result
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                key = _key(args, kwargs)
+                hit = _cache.get(key)
+                if hit is not None:
+                    logger.info(f"LLM cache hit ({namespace})")
+                    return hit
+                result = func(*args, **kwargs)
+                if _cacheable(result):
+                    _cache.set(key, result, expire=ttl)
+                return result
+
+        return wrapper
+
+    return decorator
@@ -1,29 +1,59 @@
+import asyncio
+import hashlib
 import os
 import shutil
 import subprocess
 import tempfile
+import time
 import logging
 import json
+import re
 from typing import Optional
 from pathlib import Path
 
-import cv2
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Request
-from fastapi.responses import JSONResponse
+import aiofiles
+import cachetools
+import numpy as np
+import orjson
+
+from fastapi import BackgroundTasks, FastAPI, UploadFile, File, Form, HTTPException, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 from dotenv import load_dotenv
 
+# libuv-backed event loop: drop-in, noticeably faster for the fan-out
+# Deepgram/Groq HTTP calls. Not available on Windows — fall back silently.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 # Load environment variables
 load_dotenv(encoding="utf-8")
 
-# Configure logging
+# Configure logging. Handlers are swapped for a QueueHandler so record
+# formatting and stream IO happen on a background listener thread instead
+# of blocking request coroutines.
+import logging.handlers
+import queue
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
+_log_queue = queue.SimpleQueue()
+_root_logger = logging.getLogger()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, *_root_logger.handlers, respect_handler_level=True
+)
+_root_logger.handlers = [logging.handlers.QueueHandler(_log_queue)]
+_log_listener.start()
+
 logger = logging.getLogger(__name__)
 
 # Import API clients
@@ -38,6 +68,7 @@ from groq_deepgram_client import (
 
 # Import Supabase database
 from supabase_db import initialize_supabase, UserDB, ResumeDB, InterviewDB
+from video_analysis import VideoAnalyzer
 
 # Import resume services
 from services.resume_parser import resume_parser
@@ -47,14 +78,59 @@ from services.ats_scorer import ats_scorer
 QUESTIONS = {}
 questions_path = Path(__file__).parent / "questions.json"
 if questions_path.exists():
-    with open(questions_path, "r") as f:
-        QUESTIONS = json.load(f)
+    QUESTIONS = orjson.loads(questions_path.read_bytes())
     logger.info(f"Loaded {len(QUESTIONS)} questions from questions.json")
 else:
     logger.warning("questions.json not found. Question context will be limited.")
 
+# QUESTIONS is immutable after load, so the static-question fallback cards
+# are formatted once here and indexed by role name and by question-id
+# prefix ("sde1_q1" -> "sde1"), turning the per-request O(N) scan with its
+# repeated .lower() allocations into a dict lookup.
+_QUESTION_CARDS = {
+    qid: {
+        "id": qid,
+        "question": qdata.get("question"),
+        "difficulty": "Medium",
+        "focus": "General",
+        "topic": qdata.get("role", "General"),
+    }
+    for qid, qdata in QUESTIONS.items()
+}
+_QUESTIONS_BY_ROLE = {}
+_QUESTIONS_BY_ID_PREFIX = {}
+for qid, qdata in QUESTIONS.items():
+    card = _QUESTION_CARDS[qid]
+    _QUESTIONS_BY_ROLE.setdefault(qdata.get("role", "").lower(), []).append(card)
+    _QUESTIONS_BY_ID_PREFIX.setdefault(qid.lower().split("_")[0], []).append(card)
+_DEFAULT_QUESTION_CARDS = list(_QUESTION_CARDS.values())[:3]
+# Flat id -> question-text map so the analyze hot path is one dict hit with
+# no intermediate empty-dict allocation
+QUESTION_TEXT = {qid: (qdata.get("question") or "") for qid, qdata in QUESTIONS.items()}
+
+# Content-addressed cache of parsed resume + ATS results. Re-uploading the
+# same PDF (common while users iterate on other profile fields) becomes a
+# dict hit instead of a full parse + scoring pipeline run.
+_resume_analysis_cache = cachetools.TTLCache(maxsize=256, ttl=86400)
+
+# Transcript token matchers compiled once at import (see analyze_transcript)
+WORD_RE = re.compile(r"\S+")
+FILLER_RE = re.compile(
+    r"\b(?:um|uh|like|you know|actually|basically|literally)\b",
+    re.IGNORECASE
+)
+
+# Overall-score blend: content 50%, visual 30%, speech 20%
+_SCORE_WEIGHTS = np.array([0.5, 0.3, 0.2])
+
 # Configuration from environment
 MAX_UPLOAD_MB = int(os.getenv("MAX_UPLOAD_MB", "40"))
+# Scratch space for per-request video processing. /dev/shm (tmpfs) keeps
+# the upload, proxy clip and ffmpeg traffic in RAM instead of hitting the
+# real disk several times per request; override with ANALYZE_TMP_DIR.
+ANALYZE_TMP_DIR = os.getenv(
+    "ANALYZE_TMP_DIR", "/dev/shm" if os.path.isdir("/dev/shm") else None
+)
 MAX_DURATION_SECONDS = int(os.getenv("MAX_DURATION_SECONDS", "45"))
 RATE_LIMIT = os.getenv("RATE_LIMIT_PER_MINUTE", "10/minute")
 
@@ -67,11 +143,20 @@ if os.path.exists("ffmpeg.exe"):
 app = FastAPI(
     title="AI Interview Practice Backend",
     description="Production-ready backend using Hugging Face Inference API",
-    version="2.0.0"
+    version="2.0.0",
+    # orjson encodes the nested analysis payloads at C speed; this is the
+    # dominant CPU cost of a response once the LLM results come back
+    default_response_class=ORJSONResponse,
 )
 
-# Setup rate limiting
-limiter = Limiter(key_func=get_remote_address)
+# Setup rate limiting. The default in-memory backend keeps one counter per
+# process, which silently multiplies the limit by the worker count; point
+# RATE_LIMIT_STORAGE_URI at Redis (redis://host:6379) for a global limit
+# across workers/pods. memory:// remains the single-process dev default.
+limiter = Limiter(
+    key_func=get_remote_address,
+    storage_uri=os.getenv("RATE_LIMIT_STORAGE_URI", "memory://"),
+)
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
@@ -81,6 +166,10 @@ origins = [origin.strip() for origin in allowed_origins_str.split(",")]
 
 logger.info(f"CORS allowed origins: {origins}")
 
+# Compress JSON bodies over 1 KB (transcripts + lineAnalysis are routinely
+# several KB and compress ~5-10x); small responses skip the overhead
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
@@ -92,57 +181,124 @@ app.add_middleware(
 
 def get_video_metadata(video_path: str):
     """
-    Extract video metadata using OpenCV.
+    Extract video metadata with ffprobe.
+
+    Reads fps/duration straight from the container headers rather than
+    opening a full OpenCV capture (which may scan the stream just to
+    report a frame count).
     """
-    cap = cv2.VideoCapture(video_path)
-    if not cap.isOpened():
+    command = [
+        "ffprobe", "-v", "error",
+        "-select_streams", "v:0",
+        "-show_entries", "stream=avg_frame_rate,nb_frames:format=duration",
+        "-of", "json",
+        video_path
+    ]
+    try:
+        result = subprocess.run(command, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        probe = json.loads(result.stdout)
+    except (subprocess.CalledProcessError, FileNotFoundError, json.JSONDecodeError) as e:
+        logger.error(f"ffprobe error: {e}")
         return None, "Could not open video file."
 
-    fps = cap.get(cv2.CAP_PROP_FPS)
-    frame_count = cap.get(cv2.CAP_PROP_FRAME_COUNT)
-    
-    # Calculate duration
-    duration = 0.0
-    if fps > 0:
-        duration = frame_count / fps
-    
-    cap.release()
-    
+    stream = (probe.get("streams") or [{}])[0]
+
+    # avg_frame_rate comes as a "num/den" fraction
+    fps = 0.0
+    rate = stream.get("avg_frame_rate", "0/0")
+    try:
+        num, _, den = rate.partition("/")
+        if float(den or 1) > 0:
+            fps = float(num) / float(den or 1)
+    except ValueError:
+        pass
+
+    duration = float(probe.get("format", {}).get("duration") or 0.0)
+
+    # nb_frames is absent in some containers (e.g. WebM); derive it
+    try:
+        frame_count = int(stream.get("nb_frames") or 0)
+    except ValueError:
+        frame_count = 0
+    if not frame_count and fps > 0:
+        frame_count = int(duration * fps)
+
     return {
         "fps": fps,
-        "frameCount": int(frame_count),
+        "frameCount": frame_count,
         "durationSeconds": duration
     }, None
 
 
-def extract_audio(video_path: str, audio_output_path: str):
+def extract_audio(video_path: str, small_video_out: Optional[str] = None) -> bytes:
     """
-    Use ffmpeg to extract audio from video.
-    Target: 16kHz mono WAV (ideal for Whisper).
+    Use ffmpeg to extract audio from video, returned as in-memory bytes.
+    Target: 16kHz mono FLAC — same rate STT engines use internally, but
+    losslessly compressed to roughly half the bytes of PCM WAV, so the
+    upload to Deepgram costs proportionally less. Writing to stdout
+    instead of a temp file skips a full write+read of the audio stream.
+
+    When small_video_out is given, the same ffmpeg pass fans out a second
+    output: a 360p/8fps proxy clip for the visual analyzer. Eye-contact
+    and posture metrics don't need 1080p30, and decoding the source once
+    for both outputs is nearly free next to a separate transcode.
     """
     command = [
         "ffmpeg",
         "-i", video_path,
         "-vn",                 # No video
-        "-acodec", "pcm_s16le",# PCM 16-bit little-endian
+        "-acodec", "flac",     # Lossless, ~2x smaller than PCM WAV
+        "-compression_level", "5",
         "-ar", "16000",        # 16kHz sample rate
         "-ac", "1",            # Mono channel
-        "-y",                  # Overwrite output file if exists
-        audio_output_path
+        "-f", "flac",          # Container must be explicit when piping
+        "-"                    # Write to stdout
     ]
-    
+    if small_video_out:
+        command += [
+            "-an",
+            "-vf", "scale=-2:360,fps=8",
+            "-c:v", "libx264",
+            "-preset", "ultrafast",
+            "-crf", "28",
+            small_video_out,
+        ]
+
     try:
-        subprocess.run(
-            command, 
-            check=True, 
-            stdout=subprocess.PIPE, 
+        result = subprocess.run(
+            command,
+            check=True,
+            stdout=subprocess.PIPE,
             stderr=subprocess.PIPE
         )
+        return result.stdout
     except subprocess.CalledProcessError as e:
         logger.error(f"FFmpeg error: {e.stderr.decode()}")
         raise RuntimeError("Failed to extract audio from video.")
 
 
+# --- Visual-analysis process pool -------------------------------------------
+# The OpenCV pass is the one truly CPU-bound stage; running it in dedicated
+# worker processes keeps its pure-Python portions from holding this
+# process's GIL while transcription/evaluation coroutines are in flight.
+_visual_analyzer = None
+
+
+def _init_visual_worker():
+    """Runs once per pool worker: load the Haar cascades and keep them warm"""
+    global _visual_analyzer
+    _visual_analyzer = VideoAnalyzer()
+
+
+def _process_video_in_worker(video_path: str) -> dict:
+    return _visual_analyzer.process_video(video_path)
+
+
+async def _no_line_analysis() -> dict:
+    """Stand-in awaitable for transcripts too short to label line by line"""
+    return {"lineAnalysis": [], "error": None}
+
+
 def analyze_transcript(text: str, duration_seconds: float):
     """
     Compute basic metrics from transcript.
@@ -154,24 +310,20 @@ def analyze_transcript(text: str, duration_seconds: float):
             "fillerCount": 0
         }
 
-    words = text.split()
-    word_count = len(words)
-    
+    # Count words without materializing a list of them
+    word_count = sum(1 for _ in WORD_RE.finditer(text))
+
     # Simple WPM calculation
     duration_minutes = duration_seconds / 60.0
     wpm = 0.0
     if duration_minutes > 0:
         wpm = word_count / duration_minutes
-    
-    # Filler words analysis (basic list)
-    fillers = {"um", "uh", "like", "you know", "actually", "basically", "literally"}
-    filler_count = 0
-    
-    # Normalize and check
-    processed_text = text.lower()
-    for filler in fillers:
-        filler_count += processed_text.count(filler)
-        
+
+    # Filler words: one precompiled-regex pass over the transcript instead
+    # of one full scan per filler, and word boundaries avoid substring
+    # false positives ("like" inside "likely", "uh" inside "uhm")
+    filler_count = sum(1 for _ in FILLER_RE.finditer(text))
+
     return {
         "wordCount": word_count,
         "wordsPerMinute": round(wpm, 1),
@@ -179,14 +331,30 @@ def analyze_transcript(text: str, duration_seconds: float):
     }
 
 
+# Probes (load balancers, k8s) hit /api/health every few seconds; caching
+# the upstream checks briefly keeps probes microsecond-fast and off the
+# Groq/Deepgram quota
+_health_status_cache = cachetools.TTLCache(maxsize=1, ttl=15)
+
+
 @app.get("/api/health")
-def health_check():
+async def health_check():
     """
     Health check endpoint with API status.
     """
-    groq_ok, groq_message = test_groq_connection()
-    deepgram_ok, deepgram_message = test_deepgram_connection()
-    
+    cached = _health_status_cache.get("apis")
+    if cached is not None:
+        (groq_ok, groq_message), (deepgram_ok, deepgram_message) = cached
+    else:
+        # The two connection tests are independent blocking calls; probe
+        # them concurrently so the uncached case costs max(a, b)
+        results = await asyncio.gather(
+            asyncio.to_thread(test_groq_connection),
+            asyncio.to_thread(test_deepgram_connection),
+        )
+        _health_status_cache["apis"] = results
+        (groq_ok, groq_message), (deepgram_ok, deepgram_message) = results
+
     return {
         "status": "ok",
         "groq_api": {
@@ -209,12 +377,37 @@ def health_check():
 @app.on_event("startup")
 async def startup_event():
     """Initialize Supabase connection on app startup"""
+    # Bound the default executor so the CPU-heavy to_thread work (OpenCV
+    # visual pass) can't oversubscribe cores against ffmpeg subprocesses
+    from concurrent.futures import ThreadPoolExecutor
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=max(2, (os.cpu_count() or 2) // 2))
+    )
+    # Warm VideoAnalyzer instances live in dedicated worker processes so
+    # the OpenCV pass escapes this process's GIL entirely
+    from concurrent.futures import ProcessPoolExecutor
+    app.state.visual_pool = ProcessPoolExecutor(
+        max_workers=int(os.getenv("VISUAL_WORKERS", "2")),
+        initializer=_init_visual_worker,
+    )
     if initialize_supabase():
         logger.info("✅ Supabase initialized successfully")
     else:
         logger.warning("⚠️ Supabase initialization failed - auth features will not work")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close the pooled HTTP clients so keep-alive connections drain cleanly"""
+    import groq_deepgram_client
+    import hf_client
+    await groq_deepgram_client._http.aclose()
+    await hf_client._CLIENT.aclose()
+    pool = getattr(app.state, "visual_pool", None)
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
 # ============================================================================
 # AUTHENTICATION ENDPOINTS
 # ============================================================================
@@ -240,7 +433,7 @@ async def signup(
         if len(password) < 6:
             raise HTTPException(status_code=400, detail="Password must be at least 6 characters")
         
-        user = UserDB.create_user(email=email, password=password, name=name)
+        user = await asyncio.to_thread(UserDB.create_user, email=email, password=password, name=name)
         
         if not user:
             raise HTTPException(status_code=400, detail="Email already exists or signup failed")
@@ -278,13 +471,13 @@ async def login(
         User data and session token
     """
     try:
-        user = UserDB.login_user(email=email, password=password)
+        user = await asyncio.to_thread(UserDB.login_user, email=email, password=password)
         
         if not user:
             raise HTTPException(status_code=401, detail="Invalid email or password")
         
         # Get full user profile
-        profile = UserDB.get_user(user["uid"])
+        profile = await asyncio.to_thread(UserDB.get_user, user["uid"])
         
         return {
             "success": True,
@@ -309,11 +502,43 @@ async def logout():
     return {"success": True, "message": "Logged out successfully"}
 
 
+@app.get("/api/dashboard/{user_id}")
+async def get_dashboard(user_id: str, limit: int = 10):
+    """
+    One-call dashboard fetch: profile, resume and interview history.
+
+    The three Supabase reads are independent, so they run concurrently --
+    the round costs max(RTT) instead of three sequential round-trips.
+    """
+    try:
+        profile, resume, interviews = await asyncio.gather(
+            asyncio.to_thread(UserDB.get_user, user_id),
+            asyncio.to_thread(ResumeDB.get_resume, user_id),
+            asyncio.to_thread(InterviewDB.get_user_interviews, user_id, limit),
+        )
+
+        if not profile:
+            raise HTTPException(status_code=404, detail="User not found")
+
+        return {
+            "success": True,
+            "profile": profile,
+            "resume": resume,
+            "interviews": interviews,
+        }
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Get dashboard error: {str(e)}")
+        raise HTTPException(status_code=500, detail="Failed to get dashboard")
+
+
 @app.get("/api/profile/{user_id}")
 async def get_profile(user_id: str):
     """Get user profile"""
     try:
-        profile = UserDB.get_user(user_id)
+        profile = await asyncio.to_thread(UserDB.get_user, user_id)
         
         if not profile:
             raise HTTPException(status_code=404, detail="User not found")
@@ -347,7 +572,7 @@ async def update_profile(
         if salary_expectation: profile_data["salary_expectation"] = salary_expectation
         if currency: profile_data["currency"] = currency
         
-        success = UserDB.update_profile(user_id, profile_data)
+        success = await asyncio.to_thread(UserDB.update_profile, user_id, profile_data)
         
         if not success:
             raise HTTPException(status_code=500, detail="Failed to update profile")
@@ -367,6 +592,7 @@ async def update_profile(
 
 @app.post("/api/resume/upload")
 async def upload_resume(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     user_id: str = Form(...),
     target_role: str = Form(None)
@@ -377,16 +603,33 @@ async def upload_resume(
         if not file.filename.endswith(('.pdf', '.PDF')):
             raise HTTPException(status_code=400, detail="Only PDF files are supported")
         
-        # Save file
+        # Read the PDF into memory in 1 MB chunks, folding the content hash
+        # in as bytes arrive. The bytes are parsed directly (no disk
+        # round-trip); persisting to uploads/ happens after the response.
         file_path = f"uploads/{user_id}_{file.filename}"
-        with open(file_path, "wb") as f:
-            f.write(await file.read())
-        
-        logger.info(f"Resume uploaded: {file_path}")
-        
-        # Parse resume using new parser
+        content_hash = hashlib.blake2b(digest_size=16)
+        pdf_buf = bytearray()
+        while chunk := await file.read(1 << 20):
+            content_hash.update(chunk)
+            pdf_buf += chunk
+        pdf_bytes = bytes(pdf_buf)
+        background_tasks.add_task(Path(file_path).write_bytes, pdf_bytes)
+
+        logger.info(f"Resume received: {file_path} ({len(pdf_bytes)} bytes)")
+
+        # Re-uploads of a byte-identical resume for the same target role
+        # skip the parse + ATS pipeline entirely
+        cache_key = (content_hash.hexdigest(), target_role or "")
+        cached = _resume_analysis_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Resume analysis cache hit, skipping parse/ATS pipeline")
+            background_tasks.add_task(ResumeDB.save_resume, user_id, file_path, cached)
+            return {"success": True, "data": cached}
+
+        # Parse resume using new parser (CPU-bound PDF work runs in a
+        # worker thread so it doesn't stall the event loop)
         try:
-            parsed_resume = resume_parser.parse_resume(file_path)
+            parsed_resume = await asyncio.to_thread(resume_parser.parse_resume_bytes, pdf_bytes)
             logger.info(f"Resume parsed successfully for user: {user_id}")
             
             # Calculate ATS score
@@ -433,7 +676,8 @@ async def upload_resume(
                 "analysis": analysis,
                 "ats_score": ats_result
             }
-            
+            _resume_analysis_cache[cache_key] = parsed_data
+
         except Exception as e:
             logger.error(f"Error parsing resume: {str(e)}", exc_info=True)
             # Fallback to basic parsing
@@ -450,10 +694,10 @@ async def upload_resume(
                 }
             }
         
-        # Save to Supabase
-        ResumeDB.save_resume(user_id, file_path, parsed_data)
-        logger.info(f"Resume data saved to database for user: {user_id}")
-        
+        # Save to Supabase after the response is sent — the client doesn't
+        # need to wait out the write round-trip
+        background_tasks.add_task(ResumeDB.save_resume, user_id, file_path, parsed_data)
+
         return {"success": True, "data": parsed_data}
     
     except HTTPException:
@@ -484,7 +728,7 @@ Provide a detailed analysis in the following JSON format:
 
 Be specific and actionable in your feedback."""
 
-        response = evaluate_answer_groq(
+        response = await evaluate_answer_groq(
             question=prompt,
             transcript="",  # Not needed for resume analysis
             user_context={
@@ -565,7 +809,7 @@ async def generate_questions(
         skills_list = [s.strip() for s in skills.split(",") if s.strip()]
     
     # Try to generate dynamic questions
-    result = generate_dynamic_questions(
+    result = await generate_dynamic_questions(
         role=role or "General",
         experience_years=experience_years,
         skills=skills_list,
@@ -577,32 +821,14 @@ async def generate_questions(
     if result.get("error") or not result.get("questions"):
         logger.warning(f"Dynamic generation failed: {result.get('error')}, falling back to static questions")
         
-        # Get static questions from questions.json based on role
+        # Static questions come from the precomputed role/prefix indexes;
+        # fall back to the first 3 cards when the role is unknown
         role_key = role.lower().replace(" ", "_") if role else "general"
-        static_questions = []
-        
-        for qid, qdata in QUESTIONS.items():
-            if role_key in qid.lower() or qdata.get("role", "").lower() == role.lower():
-                static_questions.append({
-                    "id": qid,
-                    "question": qdata.get("question"),
-                    "difficulty": "Medium",
-                    "focus": "General",
-                    "topic": qdata.get("role", "General")
-                })
-        
-        # If no role-specific questions, return first 3 from database
-        if not static_questions:
-            static_questions = [
-                {
-                    "id": qid,
-                    "question": qdata.get("question"),
-                    "difficulty": "Medium",
-                    "focus": "General",
-                    "topic": qdata.get("role", "General")
-                }
-                for qid, qdata in list(QUESTIONS.items())[:3]
-            ]
+        static_questions = (
+            _QUESTIONS_BY_ID_PREFIX.get(role_key)
+            or _QUESTIONS_BY_ROLE.get((role or "").lower())
+            or _DEFAULT_QUESTION_CARDS
+        )
         
         return {
             "questions": static_questions[:3],
@@ -617,6 +843,284 @@ async def generate_questions(
     }
 
 
+async def _save_upload_stream(file: UploadFile, video_path: Path) -> int:
+    """Stream the upload to disk in 1 MB chunks.
+
+    The video is never buffered whole in memory and the event loop stays
+    free during the write; size is validated as bytes arrive so oversized
+    uploads abort (413) early instead of after full receipt.
+    """
+    max_bytes = MAX_UPLOAD_MB * 1024 * 1024
+    bytes_written = 0
+    async with aiofiles.open(video_path, "wb") as buffer:
+        while chunk := await file.read(1 << 20):
+            bytes_written += len(chunk)
+            if bytes_written > max_bytes:
+                logger.warning(f"File too large: >{MAX_UPLOAD_MB}MB")
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"File too large. Maximum size is {MAX_UPLOAD_MB}MB"
+                )
+            await buffer.write(chunk)
+    return bytes_written
+
+
+async def _probe_video(video_path: Path):
+    """Probe metadata on a worker thread (ffprobe blocks) and enforce the
+    duration limit.
+
+    Returns (video_stats, error) following the get_video_metadata idiom
+    for unreadable files; raises 413 when the video is over the limit.
+    """
+    video_stats, error = await asyncio.to_thread(get_video_metadata, str(video_path))
+    if error:
+        return None, error
+    duration = video_stats["durationSeconds"]
+    if duration > MAX_DURATION_SECONDS:
+        logger.warning(f"Video too long: {duration:.1f}s > {MAX_DURATION_SECONDS}s")
+        raise HTTPException(
+            status_code=413,
+            detail=f"Video too long. Maximum duration is {MAX_DURATION_SECONDS}s, received {duration:.1f}s"
+        )
+    logger.info(f"Video metadata: {duration:.1f}s, {video_stats['fps']:.1f}fps")
+    return video_stats, None
+
+
+async def _start_transcription_and_visual(video_path: Path, temp_path: Path):
+    """Extract audio (plus the 360p proxy in the same ffmpeg pass), then
+    kick off Deepgram transcription and the OpenCV visual pass.
+
+    Returns the two in-flight tasks so callers choose how to await them:
+    the JSON path gathers both, the SSE path streams the transcript back
+    as soon as it lands while the visual pass keeps running.
+    """
+    small_video_path = temp_path / "visual_360p.mp4"
+    audio_bytes = await asyncio.to_thread(
+        extract_audio, str(video_path), str(small_video_path)
+    )
+    # Mocked/failed proxy extraction falls back to the original file
+    visual_input = str(small_video_path if small_video_path.exists() else video_path)
+
+    logger.info(f"Calling Deepgram transcription API ({len(audio_bytes)} bytes)")
+    visual_pool = getattr(app.state, "visual_pool", None)
+    if visual_pool is not None:
+        visual_task = asyncio.get_running_loop().run_in_executor(
+            visual_pool, _process_video_in_worker, visual_input
+        )
+    else:
+        # Startup hooks haven't run (e.g. TestClient) — fall back to
+        # an in-process instance on the thread pool
+        visual_task = asyncio.ensure_future(
+            asyncio.to_thread(VideoAnalyzer().process_video, visual_input)
+        )
+    # smart_format/punctuate stay on because the transcript is shown
+    # verbatim to the user
+    transcription_task = asyncio.ensure_future(
+        transcribe_audio_deepgram(
+            audio_bytes, audio_mime="audio/flac",
+            smart_format=True, punctuate=True
+        )
+    )
+    return transcription_task, visual_task
+
+
+async def _run_llm_stage(
+    transcript_text: str,
+    speech_stats: dict,
+    visual_stats: dict,
+    question_text: str,
+    role: Optional[str],
+    candidate_name: Optional[str],
+    experience_years: Optional[str],
+    salary_expectation: Optional[str],
+):
+    """Run the Groq evaluation and line-by-line analysis for one answer.
+
+    The two LLM calls share a transcript but not each other's output, so
+    they run concurrently: round latency becomes max(eval, line analysis)
+    instead of their sum. An empty transcript (failed or silent
+    recording) skips both round-trips, near-empty answers skip the line
+    analysis, and one call failing never kills the round — failures come
+    back as error dicts.
+    """
+    if not transcript_text:
+        logger.info("Transcript empty, skipping LLM evaluation and line analysis")
+        return (
+            {
+                "score": 0, "reasoning": "", "suggestions": [],
+                "error": "Transcript empty - nothing to evaluate"
+            },
+            {"lineAnalysis": [], "error": None},
+        )
+
+    logger.info(f"Calling Groq evaluation API for question: {question_text[:50]}...")
+    logger.info(f"User context: name={candidate_name}, exp={experience_years}, salary={salary_expectation}")
+
+    if speech_stats["wordCount"] >= 8:
+        line_coro = analyze_transcript_linewise(
+            transcript=transcript_text,
+            question=question_text,
+            role=role or "General"
+        )
+    else:
+        logger.info("Transcript too short for line analysis, skipping")
+        line_coro = _no_line_analysis()
+    evaluation_result, line_analysis_result = await asyncio.gather(
+        evaluate_answer_groq(
+            question=question_text,
+            transcript=transcript_text,
+            role=role or "General",
+            candidate_name=candidate_name,
+            experience_years=experience_years,
+            salary_expectation=salary_expectation,
+            visual_metrics=visual_stats,
+            speech_metrics=speech_stats
+        ),
+        line_coro,
+        return_exceptions=True
+    )
+    if isinstance(evaluation_result, Exception):
+        logger.error(f"Evaluation raised: {evaluation_result}")
+        evaluation_result = {
+            "score": 5.0,
+            "reasoning": "Evaluation unavailable",
+            "suggestions": [],
+            "error": str(evaluation_result)
+        }
+    if isinstance(line_analysis_result, Exception):
+        logger.error(f"Line analysis raised: {line_analysis_result}")
+        line_analysis_result = {"lineAnalysis": [], "error": str(line_analysis_result)}
+    return evaluation_result, line_analysis_result
+
+
+def _blend_scores(evaluation_result: dict, visual_stats: dict, speech_stats: dict) -> dict:
+    """Blend content/visual/speech into the overall score payload.
+
+    Weights: content 50%, visual 30%, speech 20% (_SCORE_WEIGHTS). The
+    speech heuristic is 100 minus capped filler and WPM-deviation
+    penalties; np.clip keeps the caps branchless and the weighted blend
+    is a single dot product. This is the one home for the scoring math —
+    the JSON and SSE paths both consume it, so they cannot drift.
+    """
+    content_score = evaluation_result.get("score", 5) * 10  # Convert 1-10 to 0-100
+    # Visual score is avg of eye contact and posture
+    visual_score = (visual_stats["eyeContact"] + visual_stats["posture"]) / 2
+    target_wpm = 130
+    wpm = speech_stats["wordsPerMinute"]
+    wpm_penalty = np.clip(abs(wpm - target_wpm) * 0.5, 0, 50) if wpm > 0 else 50
+    filler_penalty = np.clip(speech_stats["fillerCount"] * 5, 0, 30)
+    speech_score = max(0.0, 100 - wpm_penalty - filler_penalty)
+
+    overall_score = int(
+        np.dot(_SCORE_WEIGHTS, [content_score, visual_score, speech_score])
+    )
+    return {
+        "overallScore": overall_score,
+        "visualScore": int(visual_score),
+        "contentScore": int(content_score),
+        "speechScore": int(speech_score)
+    }
+
+
+async def _analyze_saved_video(
+    video_path: Path,
+    temp_path: Path,
+    role: Optional[str],
+    question_id: Optional[str],
+    question: Optional[str],
+    candidate_name: Optional[str],
+    experience_years: Optional[str],
+    salary_expectation: Optional[str],
+):
+    """Run the full analysis pipeline on a video already saved to disk.
+
+    Composes the per-stage helpers above; shared by the single-shot and
+    chunked upload paths (the SSE path reuses the same stages, emitting
+    an event after each one). The caller owns the temp directory and
+    error handling.
+    """
+    # 2. Probe metadata and validate duration (413 when over the limit)
+    video_stats, error = await _probe_video(video_path)
+    if error:
+        return ORJSONResponse(status_code=400, content={"error": error})
+    duration = video_stats["durationSeconds"]
+
+    # 3-4. Audio/proxy extraction, then Deepgram (network-bound) and the
+    # visual pass (CPU-bound, process pool) concurrently — this step costs
+    # max(transcription, visual) instead of their sum
+    transcription_task, visual_task = await _start_transcription_and_visual(
+        video_path, temp_path
+    )
+    transcription_result, visual_stats = await asyncio.gather(
+        transcription_task, visual_task
+    )
+    transcript_text = transcription_result.get("text", "").strip()
+    transcription_error = transcription_result.get("error")
+
+    if transcription_error:
+        logger.error(f"Transcription error: {transcription_error}")
+    else:
+        logger.info(f"Transcription successful: {len(transcript_text)} characters")
+
+    logger.info(f"Visual analysis: eyeContact={visual_stats['eyeContact']}, posture={visual_stats['posture']}")
+
+    # 5. Analyze Text Stats
+    speech_stats = analyze_transcript(transcript_text, duration)
+
+    # 7. Content analysis: Groq evaluation + line-by-line, concurrently
+    question_text = QUESTION_TEXT.get(question_id) or question or "General interview question"
+    evaluation_result, line_analysis_result = await _run_llm_stage(
+        transcript_text, speech_stats, visual_stats, question_text,
+        role, candidate_name, experience_years, salary_expectation
+    )
+
+    evaluation_error = evaluation_result.get("error")
+    if evaluation_error:
+        logger.error(f"Evaluation error: {evaluation_error}")
+    else:
+        logger.info(f"Evaluation successful: score={evaluation_result.get('score')}")
+
+    # 8. Overall score blend (shared with the SSE summary event)
+    scores = _blend_scores(evaluation_result, visual_stats, speech_stats)
+
+    # 9. Line-by-line transcript analysis (gathered above with the evaluation)
+    line_analysis = line_analysis_result.get("lineAnalysis", [])
+    if line_analysis_result.get("error"):
+        logger.warning(f"Line analysis error: {line_analysis_result.get('error')}")
+    else:
+        logger.info(f"Line analysis complete: {len(line_analysis)} sentences analyzed")
+
+    # 10. Build response
+    # Return response with both 'evaluation' and 'content' for compatibility
+    evaluation_data = {
+        "score": evaluation_result.get("score", 0),
+        "reasoning": evaluation_result.get("reasoning", ""),
+        "suggestions": evaluation_result.get("suggestions", []),
+        "confidence_assessment": evaluation_result.get("confidence_assessment", ""),
+        "communication_quality": evaluation_result.get("communication_quality", ""),
+        "feedback": evaluation_result.get("reasoning", "Keep practicing!")  # For frontend compatibility
+    } if not evaluation_error else None
+
+    return {
+        "role": role,
+        "questionId": question_id,
+        "transcript": transcript_text,
+        "transcriptionError": transcription_error,
+        "video": {
+            "fps": video_stats["fps"],
+            "frameCount": video_stats["frameCount"],
+            "durationSeconds": video_stats["durationSeconds"]
+        },
+        "speech": speech_stats,
+        "visual": visual_stats,
+        "evaluation": evaluation_data,  # For backend consistency
+        "content": evaluation_data,  # For frontend compatibility
+        "lineAnalysis": line_analysis,  # Sentence-by-sentence feedback
+        "evaluationError": evaluation_error,
+        **scores
+    }
+
+
 @app.post("/api/analyze")
 @limiter.limit(RATE_LIMIT)
 async def analyze_video(
@@ -642,169 +1146,259 @@ async def analyze_video(
         JSON with transcript, evaluation, and analysis metrics
     """
     logger.info(f"Processing video: role={role}, questionId={question_id}, filename={file.filename}")
-    
-    # Create a temporary directory for processing
-    with tempfile.TemporaryDirectory() as temp_dir:
+
+    # Reject obviously oversized uploads from the Content-Length header
+    # before reading a single body byte; the streamed size check below
+    # still catches clients that lie about (or omit) the header.
+    content_length = int(request.headers.get("content-length") or 0)
+    if content_length > MAX_UPLOAD_MB * 1024 * 1024:
+        logger.warning(f"Declared upload too large: {content_length} bytes > {MAX_UPLOAD_MB}MB")
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Maximum size is {MAX_UPLOAD_MB}MB"
+        )
+
+    # Create a temporary directory for processing (tmpfs-backed when available)
+    with tempfile.TemporaryDirectory(dir=ANALYZE_TMP_DIR) as temp_dir:
         try:
             temp_path = Path(temp_dir)
             video_path = temp_path / f"upload_{file.filename}"
-            audio_path = temp_path / "extracted_audio.wav"
 
-            # 1. Save Uploaded File
-            file_content = await file.read()
-            file_size_mb = len(file_content) / (1024 * 1024)
-            
-            # Validate file size
-            if file_size_mb > MAX_UPLOAD_MB:
-                logger.warning(f"File too large: {file_size_mb:.2f}MB > {MAX_UPLOAD_MB}MB")
-                raise HTTPException(
-                    status_code=413,
-                    detail=f"File too large. Maximum size is {MAX_UPLOAD_MB}MB, received {file_size_mb:.2f}MB"
-                )
-            
-            with open(video_path, "wb") as buffer:
-                buffer.write(file_content)
-            
-            logger.info(f"File saved: {file_size_mb:.2f}MB")
+            # 1. Save Uploaded File (streamed; aborts with 413 on oversize)
+            bytes_written = await _save_upload_stream(file, video_path)
+            logger.info(f"File saved: {bytes_written / (1024 * 1024):.2f}MB")
 
-            # 2. Extract Video Metadata (OpenCV)
-            video_stats, error = get_video_metadata(str(video_path))
-            if error:
-                return JSONResponse(status_code=400, content={"error": error})
-            
-            # Validate duration
-            duration = video_stats["durationSeconds"]
-            if duration > MAX_DURATION_SECONDS:
-                logger.warning(f"Video too long: {duration:.1f}s > {MAX_DURATION_SECONDS}s")
-                raise HTTPException(
-                    status_code=413,
-                    detail=f"Video too long. Maximum duration is {MAX_DURATION_SECONDS}s, received {duration:.1f}s"
-                )
-            
-            logger.info(f"Video metadata: {duration:.1f}s, {video_stats['fps']:.1f}fps")
+            # 2-10. Metadata, audio/visual, transcription, LLM evaluation,
+            # scoring and response assembly — shared with the chunked path
+            return await _analyze_saved_video(
+                video_path, temp_path, role, question_id, question,
+                candidate_name, experience_years, salary_expectation
+            )
+        
+        except HTTPException:
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error during video analysis: {str(e)}")
+            return ORJSONResponse(
+                status_code=500,
+                content={
+                    "error": "Internal server error during video analysis",
+                    "role": role,
+                    "questionId": question_id,
+                    "transcript": "",
+                    "transcriptionError": str(e)
+                }
+            )
 
-            # 3. Extract Audio (FFmpeg)
-            extract_audio(str(video_path), str(audio_path))
 
-            # 4. Transcribe using Deepgram API
-            with open(audio_path, "rb") as f:
-                audio_bytes = f.read()
-            
-            logger.info(f"Calling Deepgram transcription API ({len(audio_bytes)} bytes)")
-            transcription_result = transcribe_audio_deepgram(audio_bytes)
-            transcript_text = transcription_result.get("text", "").strip()
-            transcription_error = transcription_result.get("error")
-            
-            if transcription_error:
-                logger.error(f"Transcription error: {transcription_error}")
-            else:
-                logger.info(f"Transcription successful: {len(transcript_text)} characters")
+# --- Resumable chunked upload ---
+# Clients on flaky networks split the video into ranges and retry failed
+# chunks individually instead of re-uploading the whole file. All state
+# lives beside the spool file on disk ({id}.part pre-sized to the full
+# upload, {id}.ranges appended one "start-end" line per received chunk),
+# so any worker can serve any chunk and WORKERS > 1 just works.
 
-            # 5. Analyze Text Stats
-            speech_stats = analyze_transcript(transcript_text, duration)
+_CHUNK_SPOOL_DIR = Path(ANALYZE_TMP_DIR or tempfile.gettempdir()) / "analyze_chunks"
+_CHUNK_RANGE_RE = re.compile(r"bytes (\d+)-(\d+)/(\d+)")
+_CHUNK_ID_RE = re.compile(r"[A-Za-z0-9_-]{1,64}")
+# Abandoned uploads are swept after this long idle; the id cap bounds how
+# much spool space (tmpfs, i.e. RAM) unauthenticated clients can pin at once
+_CHUNK_UPLOAD_TTL_SECONDS = int(os.getenv("CHUNK_UPLOAD_TTL_SECONDS", "3600"))
+_MAX_CHUNK_UPLOADS = int(os.getenv("MAX_CHUNK_UPLOADS", "32"))
 
-            # 6. Visual Analysis (unchanged - runs locally)
-            from video_analysis import VideoAnalyzer
-            video_analyzer = VideoAnalyzer()
-            visual_stats = video_analyzer.process_video(str(video_path))
-            
-            logger.info(f"Visual analysis: eyeContact={visual_stats['eyeContact']}, posture={visual_stats['posture']}")
 
-            # 7. Content Analysis using Groq LLM with user context
-            # Get question text from database or use provided question
-            question_data = QUESTIONS.get(question_id, {})
-            question_text = question_data.get("question") or question or "General interview question"
-            
-            logger.info(f"Calling Groq evaluation API for question: {question_text[:50]}...")
-            logger.info(f"User context: name={candidate_name}, exp={experience_years}, salary={salary_expectation}")
-            
-            evaluation_result = evaluate_answer_groq(
-                question=question_text,
-                transcript=transcript_text,
-                role=role or "General",
-                candidate_name=candidate_name,
-                experience_years=experience_years,
-                salary_expectation=salary_expectation,
-                visual_metrics=visual_stats,
-                speech_metrics=speech_stats
-            )
-            
-            evaluation_error = evaluation_result.get("error")
-            if evaluation_error:
-                logger.error(f"Evaluation error: {evaluation_error}")
-            else:
-                logger.info(f"Evaluation successful: score={evaluation_result.get('score')}")
+def _chunk_paths(upload_id: str):
+    """Spool and range-journal paths for one upload id"""
+    return (
+        _CHUNK_SPOOL_DIR / f"{upload_id}.part",
+        _CHUNK_SPOOL_DIR / f"{upload_id}.ranges",
+    )
 
-            # 8. Calculate Overall Score
-            # Weights: Content (50%), Visual (30%), Speech (20%)
-            content_score = evaluation_result.get("score", 5) * 10  # Convert 1-10 to 0-100
-            
-            # Visual score is avg of eye contact and posture
-            visual_score = (visual_stats["eyeContact"] + visual_stats["posture"]) / 2
-            
-            # Speech score heuristic: 100 - fillers*5 - WPM deviation penalty
-            target_wpm = 130
-            wpm = speech_stats["wordsPerMinute"]
-            wpm_penalty = min(50, abs(wpm - target_wpm) * 0.5) if wpm > 0 else 50
-            filler_penalty = min(30, speech_stats["fillerCount"] * 5)
-            speech_score = max(0, 100 - wpm_penalty - filler_penalty)
-            
-            overall_score = int(
-                (content_score * 0.5) + 
-                (visual_score * 0.3) + 
-                (speech_score * 0.2)
-            )
 
-            # 9. Line-by-line transcript analysis for detailed feedback
-            line_analysis_result = analyze_transcript_linewise(
-                transcript=transcript_text,
-                question=question_text,
-                role=role or "General"
+def _read_chunk_ranges(ranges_path: Path) -> set:
+    """Parse the received (start, end) pairs from the range journal"""
+    try:
+        lines = ranges_path.read_text().split()
+    except FileNotFoundError:
+        return set()
+    ranges = set()
+    for line in lines:
+        first, _, last = line.partition("-")
+        ranges.add((int(first), int(last)))
+    return ranges
+
+
+def _chunk_received_bytes(ranges) -> int:
+    """Total bytes covered by the received (possibly overlapping) ranges"""
+    covered = 0
+    last_end = -1
+    for start, end in sorted(ranges):
+        start = max(start, last_end + 1)
+        if end >= start:
+            covered += end - start + 1
+            last_end = end
+    return covered
+
+
+def _write_chunk(part_path: Path, ranges_path: Path, data: bytes, start: int, total: int) -> set:
+    """Write one chunk at its offset and journal the range; returns all
+    ranges received so far.
+
+    Opens the spool with O_CREAT (never truncating existing data) and
+    pre-sizes it on first touch, so concurrent chunks — from this or any
+    other worker process — can land in any order. The journal append is
+    O_APPEND, which POSIX keeps atomic for writes this small.
+    """
+    fd = os.open(part_path, os.O_CREAT | os.O_WRONLY, 0o600)
+    try:
+        size = os.fstat(fd).st_size
+        if size == 0:
+            os.ftruncate(fd, total)
+        elif size != total:
+            raise HTTPException(status_code=400, detail="Total size changed mid-upload")
+        os.lseek(fd, start, os.SEEK_SET)
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    with open(ranges_path, "a") as journal:
+        journal.write(f"{start}-{start + len(data) - 1}\n")
+    return _read_chunk_ranges(ranges_path)
+
+
+def _sweep_chunk_uploads() -> None:
+    """Delete spool and journal files for uploads idle past the TTL.
+
+    Cheap enough to run inline per request: the directory is capped at
+    _MAX_CHUNK_UPLOADS uploads.
+    """
+    if not _CHUNK_SPOOL_DIR.is_dir():
+        return
+    cutoff = time.time() - _CHUNK_UPLOAD_TTL_SECONDS
+    for part in _CHUNK_SPOOL_DIR.glob("*.part"):
+        try:
+            if part.stat().st_mtime < cutoff:
+                part.unlink(missing_ok=True)
+                part.with_suffix(".ranges").unlink(missing_ok=True)
+        except OSError:
+            continue
+
+
+@app.post("/api/analyze/chunk")
+async def upload_analyze_chunk(
+    request: Request,
+    file: UploadFile = File(...),
+    upload_id: str = Form(..., alias="uploadId")
+):
+    """Receive one byte range of a chunked video upload.
+
+    Not rate-limited: a single upload legitimately sends many chunks in
+    one burst; the analysis endpoints that consume the result are.
+    """
+    if not _CHUNK_ID_RE.fullmatch(upload_id):
+        raise HTTPException(status_code=400, detail="Invalid uploadId")
+
+    match = _CHUNK_RANGE_RE.fullmatch(request.headers.get("content-range", ""))
+    if not match:
+        raise HTTPException(
+            status_code=400,
+            detail="Missing or malformed Content-Range header (expected 'bytes start-end/total')"
+        )
+    start, end, total = map(int, match.groups())
+    if start > end or end >= total:
+        raise HTTPException(status_code=400, detail="Invalid Content-Range")
+    if total > MAX_UPLOAD_MB * 1024 * 1024:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Maximum size is {MAX_UPLOAD_MB}MB"
+        )
+
+    _sweep_chunk_uploads()
+    part_path, ranges_path = _chunk_paths(upload_id)
+    _CHUNK_SPOOL_DIR.mkdir(parents=True, exist_ok=True)
+    if not part_path.exists() and len(list(_CHUNK_SPOOL_DIR.glob("*.part"))) >= _MAX_CHUNK_UPLOADS:
+        raise HTTPException(
+            status_code=503,
+            detail="Too many concurrent uploads; retry shortly"
+        )
+
+    data = await file.read()
+    if len(data) != end - start + 1:
+        raise HTTPException(status_code=400, detail="Chunk body does not match Content-Range")
+
+    ranges = await asyncio.to_thread(_write_chunk, part_path, ranges_path, data, start, total)
+
+    received = _chunk_received_bytes(ranges)
+    return {
+        "uploadId": upload_id,
+        "receivedBytes": received,
+        "totalBytes": total,
+        "complete": received == total
+    }
+
+
+@app.get("/api/analyze/chunk/{upload_id}")
+async def analyze_chunk_status(upload_id: str):
+    """Report which ranges arrived so an interrupted client can resume."""
+    if not _CHUNK_ID_RE.fullmatch(upload_id):
+        raise HTTPException(status_code=400, detail="Invalid uploadId")
+    part_path, ranges_path = _chunk_paths(upload_id)
+    try:
+        total = part_path.stat().st_size
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Unknown uploadId")
+    ranges = _read_chunk_ranges(ranges_path)
+    received = _chunk_received_bytes(ranges)
+    return {
+        "uploadId": upload_id,
+        "receivedBytes": received,
+        "totalBytes": total,
+        "complete": received == total,
+        "ranges": sorted(ranges)
+    }
+
+
+@app.post("/api/analyze/chunk/complete")
+@limiter.limit(RATE_LIMIT)
+async def complete_chunked_analyze(
+    request: Request,
+    upload_id: str = Form(..., alias="uploadId"),
+    role: Optional[str] = Form(None),
+    question_id: Optional[str] = Form(None, alias="questionId"),
+    question: Optional[str] = Form(None),
+    candidate_name: Optional[str] = Form(None, alias="candidateName"),
+    experience_years: Optional[str] = Form(None, alias="experienceYears"),
+    salary_expectation: Optional[str] = Form(None, alias="salaryExpectation")
+):
+    """Run the analysis pipeline on a fully assembled chunked upload."""
+    if not _CHUNK_ID_RE.fullmatch(upload_id):
+        raise HTTPException(status_code=400, detail="Invalid uploadId")
+    part_path, ranges_path = _chunk_paths(upload_id)
+    try:
+        total = part_path.stat().st_size
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Unknown uploadId")
+    received = _chunk_received_bytes(_read_chunk_ranges(ranges_path))
+    if received != total:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Upload incomplete: {received}/{total} bytes received"
+        )
+
+    with tempfile.TemporaryDirectory(dir=ANALYZE_TMP_DIR) as temp_dir:
+        temp_path = Path(temp_dir)
+        video_path = temp_path / f"upload_{upload_id}.mp4"
+        os.replace(part_path, video_path)
+        ranges_path.unlink(missing_ok=True)
+        try:
+            return await _analyze_saved_video(
+                video_path, temp_path, role, question_id, question,
+                candidate_name, experience_years, salary_expectation
             )
-            line_analysis = line_analysis_result.get("lineAnalysis", [])
-            if line_analysis_result.get("error"):
-                logger.warning(f"Line analysis error: {line_analysis_result.get('error')}")
-            else:
-                logger.info(f"Line analysis complete: {len(line_analysis)} sentences analyzed")
-
-            # 10. Build response
-            # Return response with both 'evaluation' and 'content' for compatibility
-            evaluation_data = {
-                "score": evaluation_result.get("score", 0),
-                "reasoning": evaluation_result.get("reasoning", ""),
-                "suggestions": evaluation_result.get("suggestions", []),
-                "confidence_assessment": evaluation_result.get("confidence_assessment", ""),
-                "communication_quality": evaluation_result.get("communication_quality", ""),
-                "feedback": evaluation_result.get("reasoning", "Keep practicing!")  # For frontend compatibility
-            } if not evaluation_error else None
-            
-            return {
-                "role": role,
-                "questionId": question_id,
-                "transcript": transcript_text,
-                "transcriptionError": transcription_error,
-                "video": {
-                    "fps": video_stats["fps"],
-                    "frameCount": video_stats["frameCount"],
-                    "durationSeconds": video_stats["durationSeconds"]
-                },
-                "speech": speech_stats,
-                "visual": visual_stats,
-                "evaluation": evaluation_data,  # For backend consistency
-                "content": evaluation_data,  # For frontend compatibility
-                "lineAnalysis": line_analysis,  # Sentence-by-sentence feedback
-                "evaluationError": evaluation_error,
-                "overallScore": overall_score,
-                "visualScore": int(visual_score),
-                "contentScore": int(content_score),
-                "speechScore": int(speech_score)
-            }
-        
         except HTTPException:
             raise
         except Exception as e:
             logger.error(f"Unexpected error during video analysis: {str(e)}")
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=500,
                 content={
                     "error": "Internal server error during video analysis",
@@ -816,7 +1410,111 @@ async def analyze_video(
             )
 
 
+def _sse_event(event: str, data) -> str:
+    """Format one Server-Sent Event frame"""
+    return f"event: {event}\ndata: {orjson.dumps(data).decode()}\n\n"
+
+
+@app.post("/api/analyze/stream")
+@limiter.limit(RATE_LIMIT)
+async def analyze_video_stream(
+    request: Request,
+    file: UploadFile = File(...),
+    role: Optional[str] = Form(None),
+    question_id: Optional[str] = Form(None, alias="questionId"),
+    question: Optional[str] = Form(None),
+    candidate_name: Optional[str] = Form(None, alias="candidateName"),
+    experience_years: Optional[str] = Form(None, alias="experienceYears"),
+    salary_expectation: Optional[str] = Form(None, alias="salaryExpectation")
+):
+    """
+    SSE variant of /api/analyze: emits each pipeline stage as it completes
+    (video metadata, transcript, metrics, evaluation, lineAnalysis, summary)
+    so the frontend can render the transcript after ~1-2s instead of
+    spinning for the whole pipeline. /api/analyze keeps the one-shot JSON
+    contract for existing clients.
+    """
+    content_length = int(request.headers.get("content-length") or 0)
+    if content_length > MAX_UPLOAD_MB * 1024 * 1024:
+        raise HTTPException(
+            status_code=413,
+            detail=f"File too large. Maximum size is {MAX_UPLOAD_MB}MB"
+        )
+
+    async def event_stream():
+        # Same per-stage helpers as _analyze_saved_video, with an SSE frame
+        # emitted after each stage instead of one JSON body at the end
+        with tempfile.TemporaryDirectory(dir=ANALYZE_TMP_DIR) as temp_dir:
+            try:
+                temp_path = Path(temp_dir)
+                video_path = temp_path / f"upload_{file.filename}"
+
+                try:
+                    await _save_upload_stream(file, video_path)
+                    video_stats, error = await _probe_video(video_path)
+                except HTTPException as e:
+                    # Oversize upload or over-limit duration
+                    yield _sse_event("error", {"error": e.detail})
+                    return
+                if error:
+                    yield _sse_event("error", {"error": error})
+                    return
+                duration = video_stats["durationSeconds"]
+                yield _sse_event("video", video_stats)
+
+                # Transcript streams back as soon as Deepgram answers; the
+                # visual pass keeps running behind it
+                transcription_task, visual_task = await _start_transcription_and_visual(
+                    video_path, temp_path
+                )
+                transcription_result = await transcription_task
+                transcript_text = transcription_result.get("text", "").strip()
+                yield _sse_event("transcript", {
+                    "transcript": transcript_text,
+                    "transcriptionError": transcription_result.get("error")
+                })
+
+                speech_stats = analyze_transcript(transcript_text, duration)
+                visual_stats = await visual_task
+                yield _sse_event("metrics", {"speech": speech_stats, "visual": visual_stats})
+
+                question_text = QUESTION_TEXT.get(question_id) or question or "General interview question"
+                evaluation_result, line_analysis_result = await _run_llm_stage(
+                    transcript_text, speech_stats, visual_stats, question_text,
+                    role, candidate_name, experience_years, salary_expectation
+                )
+
+                evaluation_error = evaluation_result.get("error")
+                yield _sse_event("evaluation", {
+                    "evaluation": None if evaluation_error else evaluation_result,
+                    "evaluationError": evaluation_error
+                })
+                yield _sse_event("lineAnalysis", {
+                    "lineAnalysis": line_analysis_result.get("lineAnalysis", [])
+                })
+
+                yield _sse_event(
+                    "summary", _blend_scores(evaluation_result, visual_stats, speech_stats)
+                )
+            except Exception as e:
+                logger.error(f"Streaming analysis error: {str(e)}")
+                yield _sse_event("error", {"error": "Internal server error during video analysis"})
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
 # Instructions for running
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop + httptools parsers are dramatically faster than the stdlib
+    # loop for multi-MB upload bodies. WORKERS defaults to 1 because the
+    # in-memory rate limiter is per-process; point RATE_LIMIT_STORAGE_URI
+    # at Redis before scaling workers up.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WORKERS", "1"))
+    )
@@ -26,12 +26,15 @@ def generate_test_video_with_audio(output_path: str, duration_seconds: int = 5,
     out = cv2.VideoWriter(temp_video, fourcc, fps, (width, height))
     
     total_frames = duration_seconds * fps
-    
+
+    # Render the static background once; each frame clones it instead of
+    # re-zeroing a fresh buffer
+    base = np.zeros((height, width, 3), dtype=np.uint8)
+
     for frame_num in range(total_frames):
-        # Create black frame
-        frame = np.zeros((height, width, 3), dtype=np.uint8)
-        
-        # Add text
+        frame = base.copy()
+
+        # Add text (changes every frame)
         text = f"Test Video - Frame {frame_num}/{total_frames}"
         cv2.putText(frame, text, (50, height//2), 
                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
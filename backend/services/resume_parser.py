@@ -1,4 +1,5 @@
 import pdfplumber
+import io
 import re
 from typing import List
 import sys
@@ -25,8 +26,8 @@ class ResumeParser:
         'agile', 'scrum', 'jira', 'linux', 'bash'
     }
     
-    def extract_text_from_pdf(self, file_path: str) -> str:
-        """Extract text from PDF file"""
+    def extract_text_from_pdf(self, file_path) -> str:
+        """Extract text from a PDF path or file-like object"""
         try:
             text = ""
             with pdfplumber.open(file_path) as pdf:
@@ -121,6 +122,14 @@ class ResumeParser:
     def parse_resume(self, file_path: str) -> ParsedResume:
         """Main parsing function"""
         raw_text = self.extract_text_from_pdf(file_path)
+        return self._build_parsed(raw_text)
+
+    def parse_resume_bytes(self, data: bytes) -> ParsedResume:
+        """Parse a PDF already held in memory (no disk round-trip)"""
+        raw_text = self.extract_text_from_pdf(io.BytesIO(data))
+        return self._build_parsed(raw_text)
+
+    def _build_parsed(self, raw_text: str) -> ParsedResume:
         return ParsedResume(
             name=self.extract_name(raw_text),
             email=self.extract_email(raw_text),
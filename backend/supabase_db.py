@@ -3,6 +3,7 @@ Supabase Database Module
 Handles Supabase database operations for users, resumes, and interviews
 """
 
+import functools
 import os
 from supabase import create_client, Client
 from datetime import datetime
@@ -11,32 +12,32 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-# Supabase client
-supabase: Optional[Client] = None
+def _now_iso() -> str:
+    """Single UTC timestamp helper shared by all DB writes"""
+    return datetime.utcnow().isoformat()
+
 
 def initialize_supabase():
     """Initialize Supabase client"""
-    global supabase
     try:
-        url = os.getenv("SUPABASE_URL")
-        key = os.getenv("SUPABASE_KEY")
-        
-        if not url or not key:
+        client = get_supabase()
+        if client is None:
             logger.error("Supabase URL or KEY not found in environment variables")
             return False
-        
-        supabase = create_client(url, key)
         logger.info("Supabase client initialized successfully")
         return True
     except Exception as e:
         logger.error(f"Failed to initialize Supabase: {str(e)}")
         return False
 
-def get_supabase() -> Client:
-    """Get Supabase client"""
-    if supabase is None:
-        initialize_supabase()
-    return supabase
+@functools.lru_cache(maxsize=1)
+def get_supabase() -> Optional[Client]:
+    """Build the Supabase client once and reuse it for every DB call"""
+    url = os.getenv("SUPABASE_URL")
+    key = os.getenv("SUPABASE_KEY")
+    if not url or not key:
+        return None
+    return create_client(url, key)
 
 # User operations
 class UserDB:
@@ -74,8 +75,8 @@ class UserDB:
                     "currency": "USD",
                     "education": [],
                     "work_history": [],
-                    "created_at": datetime.utcnow().isoformat(),
-                    "last_login": datetime.utcnow().isoformat()
+                    "created_at": (now := _now_iso()),
+                    "last_login": now
                 }
                 
                 client.table('users').insert(profile_data).execute()
@@ -110,7 +111,7 @@ class UserDB:
                 
                 # Update last login
                 client.table('users').update({
-                    "last_login": datetime.utcnow().isoformat()
+                    "last_login": _now_iso()
                 }).eq('id', user.id).execute()
                 
                 logger.info(f"User logged in: {email}")
@@ -156,7 +157,7 @@ class UserDB:
                 "currency": profile_data.get("currency", "USD"),
                 "education": profile_data.get("education", []),
                 "work_history": profile_data.get("work_history", []),
-                "updated_at": datetime.utcnow().isoformat()
+                "updated_at": _now_iso()
             }
             
             client.table('users').update(update_data).eq('id', uid).execute()
@@ -193,7 +194,7 @@ class ResumeDB:
                 "user_id": uid,
                 "file_url": file_url,
                 "parsed_data": parsed_data,
-                "uploaded_at": datetime.utcnow().isoformat()
+                "uploaded_at": _now_iso()
             }
             
             # Upsert (insert or update)
@@ -228,7 +229,7 @@ class InterviewDB:
         try:
             client = get_supabase()
             interview_data["user_id"] = uid
-            interview_data["session_date"] = datetime.utcnow().isoformat()
+            interview_data["session_date"] = _now_iso()
             
             response = client.table('interviews').insert(interview_data).execute()
             
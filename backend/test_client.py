@@ -1,64 +1,124 @@
 """
 Test client for /api/analyze endpoint.
-Usage: python test_client.py <video_file> [--role ROLE] [--question-id QUESTION_ID] [--url URL]
+Usage: python test_client.py <video_file> [<video_file> ...] [--role ROLE] [--question-id QUESTION_ID] [--url URL]
 """
 
 import sys
 import argparse
-import requests
+import asyncio
+import httpx
 import json
+import uuid
 from pathlib import Path
 import time
 
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024  # 4 MiB per chunk
 
-def test_analyze(video_path: str, role: str = None, question_id: str = None, url: str = "http://localhost:8000"):
+
+async def _post_chunked(client: httpx.AsyncClient, endpoint_base: str, video_file: Path,
+                        data: dict, chunk_size: int):
+    """Upload the video as retryable byte-range chunks, then trigger analysis.
+
+    Chunks go up four at a time; a chunk that fails is retried with
+    backoff on its own, so a blip near the end doesn't restart the upload.
+    """
+    upload_id = uuid.uuid4().hex
+    total = video_file.stat().st_size
+    ranges = [(start, min(start + chunk_size, total) - 1)
+              for start in range(0, total, chunk_size)]
+    print(f"🧩 Chunked upload: {len(ranges)} chunks of up to {chunk_size // (1024*1024)} MiB")
+
+    sem = asyncio.Semaphore(4)
+
+    async def send_chunk(start: int, end: int):
+        for attempt in range(3):
+            try:
+                async with sem:
+                    with open(video_file, 'rb') as fh:
+                        fh.seek(start)
+                        body = fh.read(end - start + 1)
+                    response = await client.post(
+                        f"{endpoint_base}/api/analyze/chunk",
+                        files={'file': ('chunk', body, 'application/octet-stream')},
+                        data={'uploadId': upload_id},
+                        headers={'Content-Range': f'bytes {start}-{end}/{total}'},
+                        timeout=60,
+                    )
+                    response.raise_for_status()
+                    return
+            except Exception as e:
+                if attempt == 2:
+                    raise
+                wait = 0.5 * (2 ** attempt)
+                print(f"  ⚠️  Chunk {start}-{end} failed ({e}); retrying in {wait:.1f}s")
+                await asyncio.sleep(wait)
+
+    await asyncio.gather(*[send_chunk(start, end) for start, end in ranges])
+
+    return await client.post(
+        f"{endpoint_base}/api/analyze/chunk/complete",
+        data={'uploadId': upload_id, **data},
+        timeout=180,
+    )
+
+
+async def test_analyze(client: httpx.AsyncClient, video_path: str, role: str = None,
+                       question_id: str = None, url: str = "http://localhost:8000",
+                       chunk_size: int = DEFAULT_CHUNK_SIZE):
     """
     Test the /api/analyze endpoint with a video file.
-    
+
     Args:
+        client: Shared AsyncClient (one connection pool for all uploads)
         video_path: Path to video file
         role: Job role (optional)
         question_id: Question ID (optional)
         url: Base URL of the API
     """
     endpoint = f"{url}/api/analyze"
-    
+
     # Check if file exists
     video_file = Path(video_path)
     if not video_file.exists():
         print(f"❌ Error: File not found: {video_path}")
         return
-    
+
     print(f"📹 Testing with video: {video_file.name}")
     print(f"📊 File size: {video_file.stat().st_size / (1024*1024):.2f} MB")
     print(f"🌐 Endpoint: {endpoint}")
     print(f"👤 Role: {role or 'Not specified'}")
     print(f"❓ Question ID: {question_id or 'Not specified'}")
     print()
-    
-    # Prepare form data
-    files = {
-        'file': (video_file.name, open(video_file, 'rb'), 'video/mp4')
-    }
-    
+
     data = {}
     if role:
         data['role'] = role
     if question_id:
         data['questionId'] = question_id
-    
+
     # Make request
     print("⏳ Sending request...")
     start_time = time.time()
-    
+
     try:
-        response = requests.post(endpoint, files=files, data=data, timeout=180)
+        if chunk_size and video_file.stat().st_size > chunk_size:
+            # Large file: resumable range chunks with per-chunk retry
+            response = await _post_chunked(client, url, video_file, data, chunk_size)
+        else:
+            # Small file: single multipart POST; httpx streams the file
+            # object chunk by chunk, so it is never buffered fully in
+            # client memory
+            with open(video_file, 'rb') as fh:
+                files = {
+                    'file': (video_file.name, fh, 'video/mp4')
+                }
+                response = await client.post(endpoint, files=files, data=data, timeout=180)
         elapsed = time.time() - start_time
-        
-        print(f"⏱️  Response time: {elapsed:.2f}s")
+
+        print(f"⏱️  Response time ({video_file.name}): {elapsed:.2f}s")
         print(f"📡 Status code: {response.status_code}")
         print()
-        
+
         if response.status_code == 200:
             result = response.json()
             print("✅ Success! Response:")
@@ -66,43 +126,54 @@ def test_analyze(video_path: str, role: str = None, question_id: str = None, url
             print(json.dumps(result, indent=2))
             print("=" * 80)
             print()
-            
+
             # Print summary
             print("📊 Summary:")
             print(f"  Transcript: {len(result.get('transcript', ''))} characters")
             print(f"  Overall Score: {result.get('overallScore', 'N/A')}/100")
-            
+
             if result.get('evaluation'):
                 eval_data = result['evaluation']
                 print(f"  Evaluation Score: {eval_data.get('score', 'N/A')}/10")
                 print(f"  Reasoning: {eval_data.get('reasoning', 'N/A')[:100]}...")
                 print(f"  Suggestions: {len(eval_data.get('suggestions', []))} items")
-            
+
             if result.get('transcriptionError'):
                 print(f"  ⚠️  Transcription Error: {result['transcriptionError']}")
-            
+
             if result.get('evaluationError'):
                 print(f"  ⚠️  Evaluation Error: {result['evaluationError']}")
-        
+
         else:
             print(f"❌ Error: {response.status_code}")
             try:
                 error_data = response.json()
                 print(json.dumps(error_data, indent=2))
-            except:
+            except Exception:
                 print(response.text)
-    
-    except requests.exceptions.Timeout:
+
+    except httpx.TimeoutException:
         print("❌ Request timeout (180s). The API may be overloaded or the video is too long.")
-    
-    except requests.exceptions.ConnectionError:
+
+    except httpx.ConnectError:
         print(f"❌ Connection error. Is the server running at {url}?")
-    
+
     except Exception as e:
         print(f"❌ Unexpected error: {str(e)}")
-    
-    finally:
-        files['file'][1].close()
+
+
+async def run_all(videos, role, question_id, url, chunk_size):
+    """Upload all videos concurrently over one shared connection pool"""
+    async with httpx.AsyncClient(
+        # Keep-alive pool sized for batch uploads; retry transient
+        # connection failures before giving up on a clip
+        limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+        transport=httpx.AsyncHTTPTransport(retries=2),
+    ) as client:
+        await asyncio.gather(*[
+            test_analyze(client, video, role, question_id, url, chunk_size)
+            for video in videos
+        ])
 
 
 def main():
@@ -112,19 +183,22 @@ def main():
         epilog="""
 Examples:
   python test_client.py video.mp4
+  python test_client.py clip1.mp4 clip2.mp4 clip3.mp4
   python test_client.py video.mp4 --role SDE1 --question-id sde1_q1
   python test_client.py video.mp4 --url https://your-app.onrender.com
         """
     )
-    
-    parser.add_argument('video', help='Path to video file')
+
+    parser.add_argument('videos', nargs='+', help='Path(s) to video file(s); multiple files upload concurrently')
     parser.add_argument('--role', help='Job role (e.g., SDE1, Frontend)')
     parser.add_argument('--question-id', help='Question ID from questions.json')
     parser.add_argument('--url', default='http://localhost:8000', help='API base URL')
-    
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help='Chunk size in bytes for resumable uploads; 0 forces single-shot')
+
     args = parser.parse_args()
-    
-    test_analyze(args.video, args.role, args.question_id, args.url)
+
+    asyncio.run(run_all(args.videos, args.role, args.question_id, args.url, args.chunk_size))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,92 @@
+"""Shared fixtures for the API tests."""
+
+import asyncio
+import copy
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import patch
+
+from main import app
+
+
+# Canonical mock responses, built once; each test gets a fresh copy
+_DEFAULT_TRANSCRIBE = {
+    "text": "This is a test transcript about debugging a production issue.",
+    "error": None
+}
+
+_DEFAULT_EVALUATE = {
+    "score": 7.5,
+    "reasoning": "Good answer with specific examples and clear structure.",
+    "suggestions": [
+        "Add more technical details",
+        "Mention specific tools used",
+        "Quantify the impact"
+    ],
+    "error": None
+}
+
+_DEFAULT_LINEWISE = {"lineAnalysis": [], "error": None}
+
+
+@pytest.fixture(scope="session")
+def _api_patchers():
+    """Start the Groq/Deepgram client patchers once for the whole session.
+
+    Targets are patched where main looks them up; patch picks AsyncMock
+    automatically for the async client functions.
+    """
+    patchers = {
+        'transcribe': patch('main.transcribe_audio_deepgram'),
+        'evaluate': patch('main.evaluate_answer_groq'),
+        'linewise': patch('main.analyze_transcript_linewise'),
+        'groq_test': patch('main.test_groq_connection'),
+        'deepgram_test': patch('main.test_deepgram_connection'),
+    }
+    mocks = {name: p.start() for name, p in patchers.items()}
+    yield mocks
+    for p in patchers.values():
+        p.stop()
+
+
+# Mock the LLM/STT client functions for every test
+@pytest.fixture(autouse=True)
+def mock_api_client(_api_patchers):
+    """Reset the shared API mocks to default responses for each test."""
+    for mock in _api_patchers.values():
+        mock.reset_mock()
+
+    _api_patchers['transcribe'].return_value = dict(_DEFAULT_TRANSCRIBE)
+    _api_patchers['evaluate'].return_value = copy.deepcopy(_DEFAULT_EVALUATE)
+    _api_patchers['linewise'].return_value = dict(_DEFAULT_LINEWISE)
+    _api_patchers['groq_test'].return_value = (True, "Connection successful")
+    _api_patchers['deepgram_test'].return_value = (True, "Connection successful")
+
+    return _api_patchers
+
+
+@pytest.fixture(scope="session")
+def client():
+    """One TestClient for the whole session; rebuilding the ASGI transport
+    per test is pure overhead."""
+    return TestClient(app)
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(monkeypatch):
+    """Never sleep for real in tests: retry backoffs and throttles resolve
+    instantly, so suite time measures work rather than waiting."""
+    async def _async_noop(*_args, **_kwargs):
+        return None
+
+    monkeypatch.setattr(time, "sleep", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr(asyncio, "sleep", _async_noop)
+
+
+@pytest.fixture(autouse=True)
+def reset_limiter():
+    """Clear rate-limiter hits between tests so the shared client's state
+    can't leak across tests."""
+    app.state.limiter.reset()
@@ -0,0 +1,66 @@
+"""
+pytest-benchmark harness for /api/analyze.
+Run with: pytest tests/test_analyze_bench.py --benchmark-only
+"""
+
+import io
+import pytest
+from unittest.mock import patch, MagicMock
+
+pytest.importorskip("pytest_benchmark")
+
+from main import app
+
+_VIDEO_BYTES = b'\x00\x00\x00\x20ftypmp42' + b'\x00' * 1000
+
+
+@pytest.fixture(autouse=True)
+def _only_when_benchmarking(request):
+    """Keep the benchmark out of normal test runs; it is opt-in."""
+    if not request.config.getoption("--benchmark-only"):
+        pytest.skip("benchmark harness; run with --benchmark-only")
+
+
+def test_analyze_latency(client, benchmark, mock_api_client):
+    """Measure end-to-end /api/analyze latency with external calls mocked,
+    so regressions in the handler itself (parsing, scoring, serialization)
+    show up rather than network noise.
+
+    mock_api_client supplies realistic transcription/evaluation dicts, so
+    the measured rounds take the full happy path — never a real network
+    call and never the empty-transcript short-circuit."""
+    with patch('main.get_video_metadata') as mock_metadata, \
+         patch('main.extract_audio'), \
+         patch('main.VideoAnalyzer') as mock_analyzer:
+
+        mock_metadata.return_value = ({
+            "fps": 30.0,
+            "frameCount": 150,
+            "durationSeconds": 5.0
+        }, None)
+
+        mock_analyzer_instance = MagicMock()
+        mock_analyzer_instance.process_video.return_value = {
+            "eyeContact": 75,
+            "posture": 80
+        }
+        mock_analyzer.return_value = mock_analyzer_instance
+
+        # Fresh body and a clean rate-limit window for every round; only
+        # the POST itself is measured
+        def setup():
+            app.state.limiter.reset()
+            return (), {
+                "files": {"file": ("test.mp4", io.BytesIO(_VIDEO_BYTES), "video/mp4")},
+                "data": {"role": "SDE1", "questionId": "sde1_q1"},
+            }
+
+        def do_post(**kwargs):
+            return client.post("/api/analyze", **kwargs)
+
+        response = benchmark.pedantic(do_post, setup=setup, rounds=20, iterations=1)
+        assert response.status_code == 200
+        # Guard against measuring the empty-transcript error path
+        data = response.json()
+        assert data["transcript"]
+        assert data["evaluation"] is not None
@@ -6,6 +6,10 @@ import os
 logger = logging.getLogger(__name__)
 
 class VideoAnalyzer:
+    # Upper bound on frames actually analyzed per video, whatever its
+    # length or fps; the sampling stride widens to stay under this.
+    MAX_ANALYZED_FRAMES = int(os.getenv("MAX_ANALYZED_FRAMES", "150"))
+
     def __init__(self):
         # Load Haar Cascade for face detection
         # OpenCV usually comes with these xml files. We will try to load from cv2 data or local.
@@ -23,6 +27,7 @@ class VideoAnalyzer:
             return {"eyeContact": 0, "posture": 0}
 
         frame_count = 0
+        processed_frames = 0
         face_detected_frames = 0
         stable_head_frames = 0
         
@@ -30,16 +35,22 @@ class VideoAnalyzer:
         centroids = []
 
         total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        
+
+        # Adaptive stride: analyze at most MAX_ANALYZED_FRAMES regardless of
+        # input fps/length so worst-case CPU per request is a constant; eye
+        # contact and posture vary slowly, so sparse sampling loses nothing.
+        stride = max(5, total_frames // self.MAX_ANALYZED_FRAMES) if total_frames > 0 else 5
+
         while True:
             ret, frame = cap.read()
             if not ret:
                 break
             
             frame_count += 1
-            # Skip frames for speed (process every 5th frame)
-            if frame_count % 5 != 0:
+            # Skip frames for speed (process every stride-th frame)
+            if frame_count % stride != 0:
                 continue
+            processed_frames += 1
 
             gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
             faces = self.face_cascade.detectMultiScale(gray, 1.1, 4)
@@ -63,7 +74,6 @@ class VideoAnalyzer:
 
         cap.release()
         
-        processed_frames = frame_count // 5
         if processed_frames == 0:
             return {"eyeContact": 0, "posture": 0}
 